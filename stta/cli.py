@@ -22,9 +22,9 @@ from . import __version__
 from .utils.logging import setup_logging
 from .io.reader import CSVReader, load_speaker_mapping
 from .io.writer import write_parquet, read_parquet
-from .schemas.calls import validate_calls_df
-from .schemas.utterances import validate_utterances_df
 from .metrics.timeline import TimelineCalculator
+from .metrics._preprocess import categorize_speakers, prepare_call_arrays
+from .metrics._text_pass import precompute_text
 from .metrics.registry import register_core_metrics, get_global_registry
 
 app = typer.Typer(
@@ -99,24 +99,19 @@ def ingest(
     ) as progress:
         task = progress.add_task("Processing files...", total=len(csv_files))
         
-        for csv_file in csv_files:
-            try:
-                progress.update(task, description=f"Processing {csv_file.name}")
-                
-                calls_df, utterances_df = reader.read_csv_file(
-                    csv_file,
-                    config['parsing']
-                )
-                
-                all_calls.append(calls_df)
-                all_utterances.append(utterances_df)
-                
-                progress.advance(task)
-                
-            except Exception as e:
-                logger.error(f"Failed to process {csv_file}: {e}")
-                console.print(f"[red]✗ {csv_file.name}: {e}[/red]")
+        for csv_file, frames, error in reader.read_csv_files(csv_files, config['parsing']):
+            progress.update(task, description=f"Processing {csv_file.name}")
+            
+            if error is not None:
+                logger.error(f"Failed to process {csv_file}: {error}")
+                console.print(f"[red]✗ {csv_file.name}: {error}[/red]")
                 continue
+            
+            calls_df, utterances_df = frames
+            all_calls.append(calls_df)
+            all_utterances.append(utterances_df)
+            
+            progress.advance(task)
     
     # Combine DataFrames
     calls_combined = pd.concat(all_calls, ignore_index=True)
@@ -125,7 +120,10 @@ def ingest(
     console.print(f"\n[green]✓[/green] Processed {len(calls_combined)} call(s)")
     console.print(f"[green]✓[/green] Extracted {len(utterances_combined)} utterance(s)")
     
-    # Validate schemas
+    # Validate schemas (pandera takes ~0.2 s to import, so only ingest loads it)
+    from .schemas.calls import validate_calls_df
+    from .schemas.utterances import validate_utterances_df
+    
     console.print("\nValidating schemas...")
     try:
         calls_combined = validate_calls_df(calls_combined)
@@ -171,6 +169,12 @@ def compute(
     calls_df = read_parquet(data_dir / "calls.parquet")
     utterances_df = read_parquet(data_dir / "utterances.parquet")
     
+    # One pass over text for text statistics, filler and quality metrics
+    precompute_text(utterances_df)
+    
+    # Fixed speaker categories: metric kernels reuse the codes per call
+    categorize_speakers(utterances_df)
+    
     console.print(f"[green]✓[/green] Loaded {len(calls_df)} calls")
     console.print(f"[green]✓[/green] Loaded {len(utterances_df)} utterances\n")
     
@@ -200,13 +204,18 @@ def compute(
             
             # Compute timeline
             timeline_stats = calc.compute_timeline_stats(call_utts)
+            timeline_stats['turns'] = calc.compute_turns_df(call_utts)
+            
+            # Mask + sort valid utterances once, shared by array-based metrics
+            call_arrays = prepare_call_arrays(call_utts)
             
             # Compute core metrics
             call_metrics = registry.compute(
                 'call_metrics',
                 call_id=call_id,
                 utterances_df=call_utts,
-                timeline_stats=timeline_stats
+                timeline_stats=timeline_stats,
+                call_arrays=call_arrays
             )
             call_metrics_list.append(call_metrics)
             
@@ -245,7 +254,8 @@ def compute(
             interaction_metrics = registry.compute(
                 'interaction_metrics',
                 utterances_df=call_utts,
-                call_id=call_id
+                call_id=call_id,
+                call_arrays=call_arrays
             )
             interaction_metrics_list.append(interaction_metrics)
             
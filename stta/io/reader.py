@@ -8,15 +8,30 @@ Handles:
 - Missing/malformed data
 """
 
+import codecs
+import hashlib
+import io
+import itertools
+import numpy as np
 import pandas as pd
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Tuple, List, Dict, Any, Optional
+from typing import Tuple, List, Dict, Any, Optional, Iterator, Iterable
 from loguru import logger
 from datetime import datetime
 import yaml
 
-from ..utils.timecode import parse_timecode, validate_time_range
-from ..utils.text import count_words, count_chars, normalize_text, is_empty_text
+from ..utils.timecode import parse_timecode, parse_timecode_series
+from ..utils.text import count_words_series, char_count_series, normalize_text, is_empty_text
+
+
+# Bytes sniffed for encoding detection
+ENCODING_SAMPLE_BYTES = 64 * 1024
+
+# Files above this size are parsed in row chunks to bound peak memory
+STREAM_MIN_BYTES = 64 * 1024 * 1024
+STREAM_CHUNK_ROWS = 100_000
 
 
 class CSVReader:
@@ -41,10 +56,61 @@ class CSVReader:
         self.speaker_mapping = speaker_mapping or {}
         self.default_speaker = "UNKNOWN"
     
+    def read_csv_files(
+        self,
+        file_paths: List[Path],
+        config: Dict[str, Any],
+        max_workers: int = 4
+    ) -> Iterator[Tuple[Path, Optional[Tuple[pd.DataFrame, pd.DataFrame]], Optional[Exception]]]:
+        """
+        Read many CSV files, overlapping disk reads with parsing.
+        
+        File contents are prefetched by a small thread pool while the
+        calling thread decodes and parses the previous file. At most
+        2 * max_workers files are held in memory at once; files larger
+        than STREAM_MIN_BYTES are not prefetched and stream from disk.
+        Results are yielded in input order.
+        
+        Args:
+            file_paths: Paths to CSV files
+            config: Configuration dict with field mappings
+            max_workers: Number of prefetch threads
+            
+        Yields:
+            (file_path, frames, error) tuples - frames is the
+            (calls_df, utterances_df) tuple on success, error is the
+            raised exception on failure (the other one is None)
+        """
+        paths = iter(file_paths)
+        window = 2 * max(1, max_workers)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            pending = deque()
+            
+            def submit_next() -> None:
+                path = next(paths, None)
+                if path is not None:
+                    pending.append((path, pool.submit(_prefetch_bytes, path)))
+            
+            for _ in range(window):
+                submit_next()
+            
+            while pending:
+                file_path, future = pending.popleft()
+                submit_next()
+                
+                try:
+                    frames = self.read_csv_file(file_path, config, data=future.result())
+                except Exception as e:
+                    yield file_path, None, e
+                else:
+                    yield file_path, frames, None
+    
     def read_csv_file(
         self,
         file_path: Path,
-        config: Dict[str, Any]
+        config: Dict[str, Any],
+        data: Optional[bytes] = None
     ) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """
         Read CSV file and split into calls and utterances.
@@ -52,6 +118,8 @@ class CSVReader:
         Args:
             file_path: Path to CSV file
             config: Configuration dict with field mappings
+            data: Raw file contents, if already read (file_path is then
+                only used for naming and logging)
             
         Returns:
             (calls_df, utterances_df) tuple
@@ -61,61 +129,122 @@ class CSVReader:
         """
         logger.info(f"Reading CSV: {file_path}")
         
-        # Try encodings in order
-        df_raw = None
-        encoding_used = None
-        
-        for encoding in self.encodings:
-            try:
-                df_raw = pd.read_csv(
-                    file_path,
-                    sep=self.delimiter,
-                    dtype=str,
-                    keep_default_na=False,
-                    encoding=encoding,
-                    on_bad_lines='warn'
-                )
-                encoding_used = encoding
-                logger.debug(f"Successfully read with encoding: {encoding}")
-                break
-            except UnicodeDecodeError:
-                logger.debug(f"Failed with encoding: {encoding}")
-                continue
-            except Exception as e:
-                logger.error(f"Unexpected error with encoding {encoding}: {e}")
-                continue
+        # Detect encoding from a leading sample instead of re-reading the
+        # whole file once per failed candidate
+        if data is None:
+            with open(file_path, 'rb') as f:
+                sample = f.read(ENCODING_SAMPLE_BYTES)
+        else:
+            sample = data[:ENCODING_SAMPLE_BYTES]
         
-        if df_raw is None:
+        encoding_used = self._detect_encoding(sample)
+        if encoding_used is None:
             raise ValueError(f"Could not read CSV with any encoding: {file_path}")
         
-        # Validate non-empty
-        if df_raw.empty:
-            raise ValueError(f"CSV file is empty: {file_path}")
+        logger.debug(f"Detected encoding: {encoding_used}")
         
-        logger.info(f"Read {len(df_raw)} rows with encoding {encoding_used}")
+        # The sample can decode with an earlier candidate than the whole
+        # file does (e.g. ASCII-only head of a cp1250 file), so fall back
+        # through the later candidates before replacing bad bytes
+        for encoding in self._encodings_from(encoding_used):
+            try:
+                return self._read_and_split(file_path, data, config, encoding)
+            except UnicodeDecodeError as e:
+                logger.debug(f"Failed with encoding {encoding} after sample: {e}")
+        
+        logger.warning(
+            f"Could not decode {file_path} with any encoding, "
+            f"reading as {encoding_used} with replacement characters"
+        )
+        return self._read_and_split(
+            file_path, data, config, encoding_used, encoding_errors='replace'
+        )
+    
+    def _encodings_from(self, encoding: str) -> List[str]:
+        """
+        Detected encoding followed by the candidates configured after it.
         
-        # Apply column mapping if configured
-        column_mapping = config.get('column_mapping', {})
-        if column_mapping:
-            df_raw = df_raw.rename(columns=column_mapping)
-            logger.debug(f"Applied column mapping: {len(column_mapping)} columns renamed")
+        Args:
+            encoding: Encoding picked from the sample
+            
+        Returns:
+            Encodings to try on the whole file, in order
+        """
+        if encoding in self.encodings:
+            return self.encodings[self.encodings.index(encoding):]
+        return [encoding] + self.encodings
+    
+    def _read_and_split(
+        self,
+        file_path: Path,
+        data: Optional[bytes],
+        config: Dict[str, Any],
+        encoding: str,
+        encoding_errors: str = 'strict'
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Parse raw CSV with a known encoding and split into calls and utterances.
         
-        # Detect multi-call format: rows with metadata = new calls, empty rows = utterances
-        # Check if we have a timestamp column that indicates call boundaries
-        timestamp_col = df_raw.columns[0] if len(df_raw.columns) > 0 else None
+        Files larger than STREAM_MIN_BYTES are read in row chunks. If the
+        first chunk shows the multi-call layout, calls are extracted chunk
+        by chunk so only one chunk of raw string rows is held at a time.
+        """
+        file_size = len(data) if data is not None else file_path.stat().st_size
+        chunks = None
         
-        # Detect if this is a multi-call CSV (metadata rows + utterance rows pattern)
-        # Note: empty values are '' (empty strings), not NaN
-        if timestamp_col:
-            filled_rows = (df_raw[timestamp_col] != '') & (df_raw[timestamp_col].notna())
-            empty_rows = (df_raw[timestamp_col] == '') | (df_raw[timestamp_col].isna())
-            has_metadata_pattern = (filled_rows.sum() > 1 and empty_rows.sum() > 0)
-        else:
-            has_metadata_pattern = False
+        try:
+            if file_size > STREAM_MIN_BYTES:
+                chunks = self._read_raw(
+                    file_path, data, encoding, encoding_errors, chunksize=STREAM_CHUNK_ROWS
+                )
+                df_raw = next(chunks, None)
+                if df_raw is None:
+                    df_raw = pd.DataFrame()
+            else:
+                df_raw = self._read_raw(file_path, data, encoding, encoding_errors)
+        except UnicodeDecodeError:
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error with encoding {encoding}: {e}")
+            raise ValueError(f"Could not parse CSV {file_path}: {e}") from e
+        
+        try:
+            # Validate non-empty
+            if df_raw.empty:
+                raise ValueError(f"CSV file is empty: {file_path}")
+            
+            if chunks is not None:
+                logger.info(f"Streaming {file_size} bytes in chunks of {STREAM_CHUNK_ROWS} rows with encoding {encoding}")
+            else:
+                logger.info(f"Read {len(df_raw)} rows with encoding {encoding}")
+            
+            # Apply column mapping if configured
+            column_mapping = config.get('column_mapping', {})
+            if column_mapping:
+                df_raw = df_raw.rename(columns=column_mapping)
+                logger.debug(f"Applied column mapping: {len(column_mapping)} columns renamed")
+            
+            has_metadata_pattern = self._has_metadata_pattern(df_raw)
+            
+            if chunks is not None:
+                rest = (chunk.rename(columns=column_mapping) for chunk in chunks)
+                
+                if has_metadata_pattern:
+                    logger.debug("Detected multi-call CSV format (metadata rows separate calls)")
+                    return self._parse_multi_call_csv(
+                        itertools.chain([df_raw], rest), file_path, config
+                    )
+                
+                # Layout not evident from the first chunk - fall back to whole file
+                df_raw = pd.concat([df_raw, *rest], ignore_index=True)
+                has_metadata_pattern = self._has_metadata_pattern(df_raw)
+        finally:
+            if chunks is not None:
+                chunks.close()
         
         if has_metadata_pattern:
             logger.debug("Detected multi-call CSV format (metadata rows separate calls)")
-            return self._parse_multi_call_csv(df_raw, file_path, config)
+            return self._parse_multi_call_csv([df_raw], file_path, config)
         else:
             logger.debug("Detected single-call CSV format")
             # Traditional format: single call
@@ -133,9 +262,75 @@ class CSVReader:
         
             return calls_df, utterances_df
     
+    def _has_metadata_pattern(self, df_raw: pd.DataFrame) -> bool:
+        """
+        Detect multi-call format: rows with metadata = new calls, empty rows = utterances.
+        
+        The first column (timestamp) is filled only on call boundary rows.
+        Note: empty values are '' (empty strings), not NaN
+        """
+        if len(df_raw.columns) == 0:
+            return False
+        
+        timestamp_col = df_raw.columns[0]
+        filled_rows = (df_raw[timestamp_col] != '') & (df_raw[timestamp_col].notna())
+        empty_rows = ~filled_rows
+        
+        return filled_rows.sum() > 1 and empty_rows.sum() > 0
+    
+    def _detect_encoding(self, sample: bytes) -> Optional[str]:
+        """
+        Pick the first configured encoding that decodes the sample.
+        
+        A UTF-8 BOM short-circuits to utf-8-sig. Decoding is incremental,
+        so a multi-byte character cut off at the end of the sample does
+        not count as a failure.
+        
+        Args:
+            sample: Leading bytes of the file
+            
+        Returns:
+            Encoding name, or None if no candidate decodes the sample
+        """
+        if sample.startswith(codecs.BOM_UTF8):
+            return 'utf-8-sig'
+        
+        for encoding in self.encodings:
+            try:
+                codecs.getincrementaldecoder(encoding)().decode(sample, final=False)
+                return encoding
+            except UnicodeDecodeError:
+                logger.debug(f"Failed with encoding: {encoding}")
+        
+        return None
+    
+    def _read_raw(
+        self,
+        file_path: Path,
+        data: Optional[bytes],
+        encoding: str,
+        encoding_errors: str = 'strict',
+        chunksize: Optional[int] = None
+    ):
+        """
+        Parse raw CSV (all columns as strings) from buffer or path.
+        
+        Returns a DataFrame, or a chunk iterator when chunksize is given.
+        """
+        return pd.read_csv(
+            io.BytesIO(data) if data is not None else file_path,
+            sep=self.delimiter,
+            dtype=str,
+            keep_default_na=False,
+            encoding=encoding,
+            encoding_errors=encoding_errors,
+            on_bad_lines='warn',
+            chunksize=chunksize
+        )
+    
     def _parse_multi_call_csv(
         self,
-        df_raw: pd.DataFrame,
+        chunks: Iterable[pd.DataFrame],
         source_file: Path,
         config: Dict[str, Any]
     ) -> Tuple[pd.DataFrame, pd.DataFrame]:
@@ -143,29 +338,17 @@ class CSVReader:
         Parse CSV with multiple calls where:
         - Rows with timestamp = call metadata (start of new call)
         - Rows without timestamp = utterances belonging to previous call
-        """
-        timestamp_col = df_raw.columns[0]
-        
-        # Identify call boundary rows (rows with non-empty timestamp)
-        # Note: empty values are '' strings, not NaN
-        is_call_start = (df_raw[timestamp_col] != '') & (df_raw[timestamp_col].notna())
-        
-        # Assign call group ID to each row
-        df_raw['_call_group'] = is_call_start.cumsum()
-        
-        logger.info(f"Detected {is_call_start.sum()} calls in CSV")
         
+        Rows arrive as consecutive chunks (a single chunk for in-memory reads).
+        """
         all_calls = []
         all_utterances = []
         
         # Process each call group
-        for call_idx, group_df in df_raw.groupby('_call_group'):
+        for call_id, group_df in self._iter_call_groups(chunks, source_file):
             # First row is metadata
             meta_row = group_df.iloc[[0]]
             
-            # Generate unique call_id from metadata
-            call_id = self._generate_call_id(meta_row.iloc[0], call_idx, source_file)
-            
             # Extract call metadata
             call_metadata = self._extract_call_metadata_from_row(
                 meta_row.iloc[0],
@@ -185,6 +368,8 @@ class CSVReader:
                 if not utterances.empty:
                     all_utterances.append(utterances)
         
+        logger.info(f"Detected {len(all_calls)} calls in CSV")
+        
         # Combine all calls and utterances
         calls_df = pd.concat(all_calls, ignore_index=True)
         utterances_df = pd.concat(all_utterances, ignore_index=True) if all_utterances else pd.DataFrame()
@@ -193,6 +378,99 @@ class CSVReader:
         
         return calls_df, utterances_df
     
+    def _iter_call_groups(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        source_file: Path
+    ) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        Yield (call_id, rows) per call from consecutive row chunks.
+        
+        Call groups are numbered by a running count of call boundary rows
+        (non-empty timestamp). A call cut off at the end of a chunk is
+        carried over and completed from the next chunk.
+        """
+        carry_idx = None
+        carry_df = None
+        calls_seen = 0
+        call_ids = {}
+        
+        for chunk in chunks:
+            if chunk.empty:
+                continue
+            
+            # Identify call boundary rows (rows with non-empty timestamp)
+            # Note: empty values are '' strings, not NaN
+            timestamp_col = chunk.columns[0]
+            is_call_start = (chunk[timestamp_col] != '') & (chunk[timestamp_col].notna())
+            
+            # Assign call group ID to each row
+            call_group = is_call_start.cumsum() + calls_seen
+            calls_seen = int(call_group.iloc[-1])
+            
+            # Hash ids for all calls starting in this chunk at once
+            call_ids.update(self._generate_call_ids(
+                chunk[is_call_start], call_group[is_call_start]
+            ))
+            
+            for call_idx, group_df in chunk.groupby(call_group):
+                if call_idx == carry_idx:
+                    group_df = pd.concat([carry_df, group_df])
+                elif carry_df is not None:
+                    yield self._pop_call_id(call_ids, carry_idx, carry_df, source_file), carry_df
+                
+                carry_idx, carry_df = call_idx, group_df
+        
+        if carry_df is not None:
+            yield self._pop_call_id(call_ids, carry_idx, carry_df, source_file), carry_df
+    
+    def _pop_call_id(
+        self,
+        call_ids: Dict[int, str],
+        call_idx: int,
+        group_df: pd.DataFrame,
+        source_file: Path
+    ) -> str:
+        """Take precomputed call_id, or hash it from the group's first row (leading rows before any boundary)."""
+        call_id = call_ids.pop(call_idx, None)
+        if call_id is None:
+            call_id = self._generate_call_id(group_df.iloc[0], call_idx, source_file)
+        return call_id
+    
+    def _generate_call_ids(
+        self,
+        meta_rows: pd.DataFrame,
+        call_idx: pd.Series
+    ) -> Dict[int, str]:
+        """
+        Generate call_ids for many metadata rows at once.
+        
+        Builds the key strings with vectorized concatenation; only the MD5
+        digest itself runs per call. Ids match _generate_call_id.
+        
+        Args:
+            meta_rows: Call boundary rows
+            call_idx: Call group index of each row
+            
+        Returns:
+            Dict call_idx -> call_id
+        """
+        if meta_rows.empty:
+            return {}
+        
+        # Use timestamp + agent + customer + index for uniqueness
+        empty = pd.Series('', index=meta_rows.index)
+        timestamp = meta_rows.iloc[:, 0].astype(str)
+        agent = meta_rows['agent_name'].astype(str) if 'agent_name' in meta_rows else empty
+        customer = meta_rows['customer_id'].astype(str) if 'customer_id' in meta_rows else empty
+        
+        unique_strs = timestamp + '_' + agent + '_' + customer + '_' + call_idx.astype(str)
+        
+        return {
+            idx: f"call_{hashlib.md5(unique_str.encode()).hexdigest()[:8]}"
+            for idx, unique_str in zip(call_idx.tolist(), unique_strs.tolist())
+        }
+    
     def _generate_call_id(
         self,
         meta_row: pd.Series,
@@ -200,8 +478,6 @@ class CSVReader:
         source_file: Path
     ) -> str:
         """Generate unique call_id from metadata."""
-        import hashlib
-        
         # Use timestamp + agent + customer + index for uniqueness
         timestamp = str(meta_row.get(meta_row.index[0], ''))  # First column (timestamp)
         agent = str(meta_row.get('agent_name', ''))
@@ -332,79 +608,77 @@ class CSVReader:
     ) -> pd.DataFrame:
         """Extract and normalize utterances."""
         
-        utterances = []
-        
         # Field names from config
         speaker_field = config.get('speaker_field', 'speaker')
         text_field = config.get('text_field', 'text')
         start_field = config.get('start_time_field', 'start_time')
         end_field = config.get('end_time_field', 'end_time')
         
-        for idx, row in utter_rows.iterrows():
-            # Extract raw values
-            raw_speaker = row.get(speaker_field, '').strip()
-            text = normalize_text(row.get(text_field, ''))
-            raw_start = row.get(start_field, '').strip()
-            raw_end = row.get(end_field, '').strip()
-            
-            # Normalize speaker
-            speaker = self.speaker_mapping.get(raw_speaker, self.default_speaker)
-            if speaker == self.default_speaker and raw_speaker:
-                logger.debug(f"Unknown speaker label: {raw_speaker}")
-            
-            # Parse times
-            start_sec = None
-            end_sec = None
-            duration_sec = None
-            valid_time = False
-            invalid_reason = None
-            
-            try:
-                if raw_start and raw_end:
-                    start_sec = parse_timecode(raw_start)
-                    end_sec = parse_timecode(raw_end)
-                    
-                    # Validate range
-                    is_valid, reason = validate_time_range(start_sec, end_sec)
-                    if is_valid:
-                        duration_sec = end_sec - start_sec
-                        valid_time = True
-                    else:
-                        invalid_reason = reason
-                        valid_time = False
-                else:
-                    invalid_reason = "missing_time"
-                    valid_time = False
-            except (ValueError, Exception) as e:
-                logger.debug(f"Invalid timecode in row {idx}: {e}")
-                invalid_reason = "parse_error"
-                valid_time = False
-            
-            # Text metrics
-            char_count = count_chars(text)
-            word_count = count_words(text)
-            
-            utterance = {
-                'call_id': call_id,
-                'utt_id': f"{call_id}-{len(utterances):05d}",
-                'utterance_index': len(utterances),  # Will be re-sorted later
-                'speaker': speaker,
-                'start_sec': start_sec,
-                'end_sec': end_sec,
-                'duration_sec': duration_sec,
-                'text': text,
-                'char_count': char_count,
-                'word_count': word_count,
-                'valid_time': valid_time,
-                'invalid_reason': invalid_reason
-            }
-            
-            utterances.append(utterance)
+        def column(field: str) -> pd.Series:
+            """Stripped raw column ('' if the column is missing)."""
+            if field in utter_rows.columns:
+                return utter_rows[field].str.strip()
+            return pd.Series('', index=utter_rows.index, dtype=object)
         
-        df = pd.DataFrame(utterances)
+        raw_speaker = column(speaker_field)
+        raw_start = column(start_field)
+        raw_end = column(end_field)
+        
+        if text_field in utter_rows.columns:
+            texts = [normalize_text(t) for t in utter_rows[text_field]]
+        else:
+            texts = [''] * len(utter_rows)
+        
+        # Normalize speaker
+        speakers = [self.speaker_mapping.get(s, self.default_speaker) for s in raw_speaker]
+        unknown = dict.fromkeys(r for r, s in zip(raw_speaker, speakers) if s == self.default_speaker and r)
+        for raw in unknown:
+            logger.debug("Unknown speaker label: {}", raw)
+        
+        # Parse times for the whole call at once (NaN where unparsable)
+        start_parsed = parse_timecode_series(raw_start, errors='coerce')
+        end_parsed = parse_timecode_series(raw_end, errors='coerce')
+        
+        has_times = (raw_start != '') & (raw_end != '')
+        start_ok = start_parsed.notna()
+        parsed = has_times & start_ok & end_parsed.notna()
+        valid_time = parsed & (end_parsed > start_parsed)
+        
+        # End is only kept when start parsed (same as parsing start first)
+        start_sec = start_parsed.where(has_times)
+        end_sec = end_parsed.where(has_times & start_ok)
+        duration_sec = (end_parsed - start_parsed).where(valid_time)
+        
+        invalid_reason = np.select(
+            [~has_times.to_numpy(), ~parsed.to_numpy(), ~valid_time.to_numpy()],
+            ['missing_time', 'parse_error', 'nonpositive_duration'],
+            default=None
+        )
+        
+        if (has_times & ~parsed).any():
+            logger.debug("Invalid timecodes in {} rows", int((has_times & ~parsed).sum()))
+        
+        n = len(utter_rows)
+        df = pd.DataFrame({
+            'call_id': call_id,
+            'utt_id': [f"{call_id}-{i:05d}" for i in range(n)],
+            'utterance_index': range(n),  # Will be re-sorted later
+            'speaker': speakers,
+            'start_sec': start_sec.to_numpy(),
+            'end_sec': end_sec.to_numpy(),
+            'duration_sec': duration_sec.to_numpy(),
+            'text': texts,
+            'valid_time': valid_time.to_numpy(),
+            'invalid_reason': invalid_reason
+        })
         
         # Sort by time (valid times first, then by start_sec)
         if not df.empty:
+            # Text metrics (one pass per column, placed after text)
+            text_pos = df.columns.get_loc('text')
+            df.insert(text_pos + 1, 'char_count', char_count_series(df['text']))
+            df.insert(text_pos + 2, 'word_count', count_words_series(df['text']))
+            
             df = df.sort_values(
                 by=['valid_time', 'start_sec'],
                 ascending=[False, True],
@@ -425,6 +699,22 @@ class CSVReader:
         return df
 
 
+def _prefetch_bytes(path: Path) -> Optional[bytes]:
+    """
+    Read a small file into memory for parsing.
+    
+    Args:
+        path: Path to CSV file
+        
+    Returns:
+        File contents, or None for files above STREAM_MIN_BYTES (these
+        are read from disk in row chunks instead)
+    """
+    if path.stat().st_size > STREAM_MIN_BYTES:
+        return None
+    return path.read_bytes()
+
+
 def load_speaker_mapping(config_path: Path) -> Dict[str, str]:
     """
     Load speaker mapping from YAML config.
@@ -0,0 +1,134 @@
+"""
+Per-call array preparation shared by the metric functions.
+
+Masking valid utterances and sorting them by start time is the same for
+every metric, so it is done once per call and the result is passed on as
+plain NumPy arrays (structure of arrays).
+"""
+
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+
+
+# Speaker label -> int8 code used by the array kernels (-1 = unmapped label)
+SPEAKER_CODES = ['AGENT', 'CUSTOMER', 'OTHER', 'UNKNOWN']
+AGENT_CODE = SPEAKER_CODES.index('AGENT')
+CUSTOMER_CODE = SPEAKER_CODES.index('CUSTOMER')
+
+# Speaker column dtype for loaded utterances; .cat.codes are then the codes above
+SPEAKER_DTYPE = pd.CategoricalDtype(categories=SPEAKER_CODES)
+
+# Cached per-utterance length of stripped text (added by the text pass)
+TEXT_STRIPPED_LEN = '_text_stripped_len'
+
+# Calls with more valid utterances than this use the fused Numba kernels;
+# below it the NumPy path wins over kernel call overhead
+KERNEL_MIN_UTTERANCES = 64
+
+
+@dataclass(frozen=True)
+class ValidUtterances:
+    """
+    Valid utterances of one call, sorted by start_sec.
+
+    Relies on the reader invariant that utterance_index follows start_sec
+    for valid utterances, so these arrays are also in turn order. Already
+    sorted input (as produced by the reader) is detected and not re-sorted.
+    """
+    start: np.ndarray
+    end: np.ndarray
+    speaker_code: np.ndarray
+    word_count: np.ndarray
+    duration: np.ndarray
+
+    def __len__(self) -> int:
+        return self.start.shape[0]
+
+
+def encode_speakers(speakers) -> np.ndarray:
+    """
+    Encode speaker labels as int8 codes (see SPEAKER_CODES).
+
+    Args:
+        speakers: Array-like of speaker labels
+
+    Returns:
+        int8 array of codes
+    """
+    if isinstance(speakers, pd.Series) and speakers.dtype == SPEAKER_DTYPE:
+        return speakers.cat.codes.to_numpy()
+    return pd.Categorical(speakers, categories=SPEAKER_CODES).codes
+
+
+def sum_by_speaker(speaker_code: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    Sum values per speaker code in one pass (unmapped codes are skipped).
+
+    Args:
+        speaker_code: int8 speaker codes (see SPEAKER_CODES)
+        values: Values aligned with speaker_code
+
+    Returns:
+        Array of sums indexed by speaker code
+    """
+    known = speaker_code >= 0
+    return np.bincount(speaker_code[known], weights=values[known], minlength=len(SPEAKER_CODES))
+
+
+def prepare_call_arrays(utterances_df: pd.DataFrame) -> ValidUtterances:
+    """
+    Build sorted column arrays for the valid utterances of a call.
+
+    Args:
+        utterances_df: Utterances for a single call
+
+    Returns:
+        ValidUtterances with start, end, speaker_code, word_count, duration
+    """
+    valid_df = utterances_df[utterances_df['valid_time']]
+    # O(n) check; the reader's output is already in start order
+    if not valid_df['start_sec'].is_monotonic_increasing:
+        valid_df = valid_df.sort_values('start_sec', kind='stable')
+
+    return ValidUtterances(
+        start=valid_df['start_sec'].to_numpy(dtype=np.float64),
+        end=valid_df['end_sec'].to_numpy(dtype=np.float64),
+        speaker_code=encode_speakers(valid_df['speaker']),
+        word_count=valid_df['word_count'].to_numpy(dtype=np.int64),
+        duration=valid_df['duration_sec'].to_numpy(dtype=np.float64)
+    )
+
+
+def categorize_speakers(utterances_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert the speaker column to SPEAKER_DTYPE in place.
+    
+    Labels outside SPEAKER_CODES would become NaN, so the column is left
+    as is when any are present.
+    
+    Args:
+        utterances_df: Utterances (any number of calls)
+        
+    Returns:
+        The same DataFrame
+    """
+    speakers = utterances_df['speaker']
+    if speakers.dtype != SPEAKER_DTYPE and speakers.isin(SPEAKER_CODES).all():
+        utterances_df['speaker'] = speakers.astype(SPEAKER_DTYPE)
+    return utterances_df
+
+
+def text_stripped_len(utterances_df: pd.DataFrame) -> pd.Series:
+    """
+    Stripped text length per utterance, from the cached column if present.
+
+    Args:
+        utterances_df: Utterances
+
+    Returns:
+        Series of lengths (NaN for missing text)
+    """
+    if TEXT_STRIPPED_LEN in utterances_df.columns:
+        return utterances_df[TEXT_STRIPPED_LEN]
+    return utterances_df['text'].str.strip().str.len()
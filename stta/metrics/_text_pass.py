@@ -0,0 +1,86 @@
+"""
+Single pass over utterance text shared by the text-based metrics.
+
+Text statistics, filler words and quality metrics all scan the `text`
+column. precompute_text walks it once (for all calls at the same time)
+and stores per-utterance counts in helper columns; the metric functions
+then only sum these columns per call. Per-utterance counts add up to the
+same totals as counting over the joined call text, since tokens are
+whitespace-delimited and utterances are joined with a space.
+"""
+
+import re
+import pandas as pd
+
+from ._preprocess import TEXT_STRIPPED_LEN
+
+
+# Czech filler words
+_CZECH_FILLERS = frozenset((
+    'ehm', 'em', 'hm', 'hmm', 'aha', 'ano', 'eh', 'uh', 'um',
+    'jako', 'jakoby', 'vlastně', 'víš', 'víte', 'teda', 'prostě',
+    'tak', 'takže', 'no', 'jo', 'ježiš', 'kruci'
+))
+
+# Whole whitespace-delimited tokens equal to a filler (same tokens as str.split())
+_FILLER_RE = re.compile(
+    r'(?<!\S)(?:'
+    + '|'.join(map(re.escape, sorted(_CZECH_FILLERS, key=lambda w: (-len(w), w))))
+    + r')(?!\S)'
+)
+
+# Whitespace-delimited tokens (counts match len(str.split()))
+_WORD_PATTERN = r'\S+'
+
+# Helper columns added by precompute_text
+WORDS_LOWER = '_words_lower'    # lowercased text
+QUESTION_N = '_q'               # '?' count
+EXCLAMATION_N = '_e'            # '!' count
+FILLER_N = '_filler_n'          # filler token count
+WORD_N = '_word_n'              # whitespace token count
+
+
+def precompute_text(utterances_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add text pass columns to utterances in place.
+
+    Adds WORDS_LOWER, QUESTION_N, EXCLAMATION_N, FILLER_N, WORD_N and
+    TEXT_STRIPPED_LEN (missing text stays NaN there so it never counts
+    as empty).
+
+    Args:
+        utterances_df: Utterances (any number of calls)
+
+    Returns:
+        The same DataFrame
+    """
+    text = utterances_df['text']
+    text_str = text.fillna('').astype(str)
+    lower = text_str.str.lower()
+
+    utterances_df[TEXT_STRIPPED_LEN] = text.str.strip().str.len()
+    utterances_df[WORDS_LOWER] = lower
+    utterances_df[QUESTION_N] = text_str.str.count(r'\?')
+    utterances_df[EXCLAMATION_N] = text_str.str.count('!')
+    utterances_df[FILLER_N] = lower.str.count(_FILLER_RE)
+    # flags keep Python's re (Unicode \s); Arrow-backed strings would
+    # otherwise use RE2, where \s is ASCII-only
+    utterances_df[WORD_N] = lower.str.count(_WORD_PATTERN, flags=re.UNICODE)
+
+    return utterances_df
+
+
+def ensure_text_pass(utterances_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return utterances with text pass columns, computing them on a copy if missing.
+
+    Args:
+        utterances_df: Utterances
+
+    Returns:
+        DataFrame with text pass columns
+    """
+    if FILLER_N in utterances_df.columns:
+        return utterances_df
+
+    return precompute_text(utterances_df.copy())
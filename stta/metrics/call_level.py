@@ -2,16 +2,23 @@
 
 import pandas as pd
 import numpy as np
-from typing import Dict
+from typing import Dict, Optional
 from loguru import logger
 
-from .timeline import TimelineCalculator
+from ..utils.jit import njit, NUMBA_AVAILABLE
+from ._preprocess import (
+    ValidUtterances,
+    prepare_call_arrays,
+    SPEAKER_CODES,
+    KERNEL_MIN_UTTERANCES
+)
 
 
 def compute_call_metrics(
     call_id: str,
     utterances_df: pd.DataFrame,
-    timeline_stats: Dict
+    timeline_stats: Dict,
+    call_arrays: Optional[ValidUtterances] = None
 ) -> Dict:
     """
     Compute all call-level metrics.
@@ -20,15 +27,17 @@ def compute_call_metrics(
         call_id: Call identifier
         utterances_df: Utterances for this call
         timeline_stats: Pre-computed timeline statistics
+        call_arrays: Pre-built sorted arrays for this call (built if None)
         
     Returns:
         Dictionary of call-level metrics
     """
-    valid_df = utterances_df[utterances_df['valid_time']]
+    if call_arrays is None:
+        call_arrays = prepare_call_arrays(utterances_df)
     
     # Basic counts
     total_utterances = len(utterances_df)
-    valid_utterances = len(valid_df)
+    valid_utterances = len(call_arrays)
     invalid_utterances = total_utterances - valid_utterances
     
     # Timeline metrics (from timeline_stats)
@@ -43,15 +52,37 @@ def compute_call_metrics(
     overlap_ratio = O / T if T > 0 else 0.0
     speech_to_silence_ratio = L / S if S > 0 else float('inf')
     
+    speaker_code = call_arrays.speaker_code
+    duration = call_arrays.duration
+    word_count = call_arrays.word_count
+    gap_values = call_arrays.start[1:] - call_arrays.end[:-1]
+    
+    # Sums and counters: one fused pass for large calls, NumPy otherwise
+    if NUMBA_AVAILABLE and valid_utterances > KERNEL_MIN_UTTERANCES:
+        (duration_sum, total_words, gap_sum, negative_gaps, speaker_switches,
+         interruptions_total, interruptions_by_code) = _call_kernel(
+            call_arrays.start, call_arrays.end, speaker_code,
+            duration, word_count, len(SPEAKER_CODES)
+        )
+        interruptions = _interruptions_dict(interruptions_total, interruptions_by_code)
+    else:
+        duration_sum = duration.sum()
+        total_words = word_count.sum()
+        gap_sum = gap_values.sum()
+        negative_gaps = int(np.count_nonzero(gap_values < 0))
+        speaker_switches = int(np.count_nonzero(speaker_code[1:] != speaker_code[:-1]))
+        
+        # Count interruptions (speaker change with overlap)
+        interruptions = _count_interruptions(call_arrays)
+    
     # Utterance statistics
     if valid_utterances > 0:
-        avg_utt_duration = valid_df['duration_sec'].mean()
-        median_utt_duration = valid_df['duration_sec'].median()
-        p95_utt_duration = valid_df['duration_sec'].quantile(0.95)
+        avg_utt_duration = duration_sum / valid_utterances
+        median_utt_duration = np.median(duration)
+        p95_utt_duration = np.quantile(duration, 0.95)
         
-        avg_utt_words = valid_df['word_count'].mean()
-        median_utt_words = valid_df['word_count'].median()
-        total_words = valid_df['word_count'].sum()
+        avg_utt_words = total_words / valid_utterances
+        median_utt_words = np.median(word_count)
     else:
         avg_utt_duration = 0.0
         median_utt_duration = 0.0
@@ -60,33 +91,24 @@ def compute_call_metrics(
         median_utt_words = 0.0
         total_words = 0
     
-    # Compute gaps
-    calc = TimelineCalculator()
-    gaps = calc.compute_gaps(utterances_df)
-    
-    if gaps:
-        gap_values = [g['gap_sec'] for g in gaps]
-        avg_gap = np.mean(gap_values)
+    # Gap statistics
+    if gap_values.size > 0:
+        avg_gap = gap_sum / gap_values.size
         median_gap = np.median(gap_values)
         p95_gap = np.percentile(gap_values, 95)
-        negative_gaps = sum(1 for g in gap_values if g < 0)
     else:
         avg_gap = 0.0
         median_gap = 0.0
         p95_gap = 0.0
         negative_gaps = 0
     
-    # Compute turns and switches
-    turns = calc.compute_turns(utterances_df)
-    total_turns = len(turns)
+    # Turns are maximal runs of the same speaker
+    total_turns = speaker_switches + 1 if valid_utterances > 0 else 0
     
     # Count speaker switches (turn boundaries)
     speaker_switches = max(0, total_turns - 1)
     switches_per_min = (speaker_switches / (T / 60)) if T > 0 else 0.0
     
-    # Count interruptions (speaker change with overlap)
-    interruptions = _count_interruptions(utterances_df)
-    
     metrics = {
         'call_id': call_id,
         
@@ -133,46 +155,81 @@ def compute_call_metrics(
         'interruptions_by_other': interruptions['OTHER']
     }
     
-    logger.debug(f"Computed call metrics for {call_id}")
+    logger.debug("Computed call metrics for {}", call_id)
     
     return metrics
 
 
-def _count_interruptions(utterances_df: pd.DataFrame) -> Dict[str, int]:
+def _count_interruptions(call_arrays: ValidUtterances) -> Dict[str, int]:
     """
     Count interruptions by speaker.
     
     An interruption occurs when speaker Y starts before speaker X finishes.
     
     Args:
-        utterances_df: Sorted utterances
+        call_arrays: Sorted valid utterance arrays
         
     Returns:
         Dictionary with counts by speaker
     """
-    valid_df = utterances_df[utterances_df['valid_time']].copy()
-    valid_df = valid_df.sort_values('start_sec').reset_index(drop=True)
-    
-    interruptions = {
-        'total': 0,
-        'AGENT': 0,
-        'CUSTOMER': 0,
-        'OTHER': 0,
-        'UNKNOWN': 0
-    }
+    code = call_arrays.speaker_code
     
-    for i in range(len(valid_df) - 1):
-        curr = valid_df.iloc[i]
-        next_utt = valid_df.iloc[i + 1]
-        
-        # Interruption: next starts before curr ends AND different speaker
-        if (next_utt['start_sec'] < curr['end_sec'] and 
-            next_utt['speaker'] != curr['speaker']):
-            
-            interrupting_speaker = next_utt['speaker']
-            interruptions['total'] += 1
-            
-            if interrupting_speaker in interruptions:
-                interruptions[interrupting_speaker] += 1
+    # Interruption: next starts before curr ends AND different speaker
+    is_interruption = (
+        (call_arrays.start[1:] < call_arrays.end[:-1]) &
+        (code[1:] != code[:-1])
+    )
+    interrupting = code[1:][is_interruption]
+    by_speaker = np.bincount(interrupting[interrupting >= 0], minlength=len(SPEAKER_CODES))
+    
+    return _interruptions_dict(int(is_interruption.sum()), by_speaker)
+
+
+def _interruptions_dict(total: int, by_speaker: np.ndarray) -> Dict[str, int]:
+    """Map per-code interruption counts to the speaker-keyed result dict."""
+    interruptions = {'total': int(total)}
+    for speaker_idx, speaker in enumerate(SPEAKER_CODES):
+        interruptions[speaker] = int(by_speaker[speaker_idx])
     
     return interruptions
+
+
+@njit(cache=True, nogil=True)
+def _call_kernel(start, end, speaker_code, duration, word_count, n_speakers):
+    """
+    Fused single pass over sorted valid utterances.
+    
+    Returns:
+        (duration_sum, words_sum, gap_sum, negative_gaps, speaker_switches,
+         interruptions_total, interruptions_by_code)
+    """
+    duration_sum = 0.0
+    words_sum = 0
+    gap_sum = 0.0
+    negative_gaps = 0
+    speaker_switches = 0
+    interruptions_total = 0
+    interruptions_by_code = np.zeros(n_speakers, dtype=np.int64)
+    
+    for i in range(start.shape[0]):
+        duration_sum += duration[i]
+        words_sum += word_count[i]
+        
+        if i == 0:
+            continue
+        
+        gap = start[i] - end[i - 1]
+        gap_sum += gap
+        if gap < 0:
+            negative_gaps += 1
+        
+        code = speaker_code[i]
+        if code != speaker_code[i - 1]:
+            speaker_switches += 1
+            if start[i] < end[i - 1]:
+                interruptions_total += 1
+                if code >= 0:
+                    interruptions_by_code[code] += 1
+    
+    return (duration_sum, words_sum, gap_sum, negative_gaps, speaker_switches,
+            interruptions_total, interruptions_by_code)
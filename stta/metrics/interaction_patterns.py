@@ -2,84 +2,77 @@
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any
+from typing import Dict, Any, Tuple, Optional
 from loguru import logger
 
+from ..utils.jit import njit, NUMBA_AVAILABLE
+from ._preprocess import (
+    ValidUtterances,
+    prepare_call_arrays,
+    SPEAKER_CODES,
+    AGENT_CODE,
+    CUSTOMER_CODE,
+    KERNEL_MIN_UTTERANCES
+)
 
-def compute_interaction_metrics(utterances_df: pd.DataFrame, call_id: str) -> Dict[str, Any]:
+
+def compute_interaction_metrics(
+    utterances_df: pd.DataFrame,
+    call_id: str,
+    call_arrays: Optional[ValidUtterances] = None
+) -> Dict[str, Any]:
     """
     Compute interaction pattern metrics.
     
     Args:
         utterances_df: DataFrame with utterances for a single call
         call_id: Unique call identifier
+        call_arrays: Pre-built sorted arrays for this call (built if None)
         
     Returns:
         Dictionary with interaction metrics
     """
+    if call_arrays is None:
+        call_arrays = prepare_call_arrays(utterances_df)
     
-    valid_utts = utterances_df[utterances_df['valid_time']].copy()
-    
-    if len(valid_utts) < 2:
+    if len(call_arrays) < 2:
         return _empty_interaction_metrics(call_id)
     
-    # Sort by start time
-    valid_utts = valid_utts.sort_values('start_sec').reset_index(drop=True)
+    start = call_arrays.start
+    end = call_arrays.end
+    speaker_code = call_arrays.speaker_code
     
     # 1. Calculate gaps between utterances
-    gaps = []
-    for i in range(len(valid_utts) - 1):
-        gap = valid_utts.iloc[i + 1]['start_sec'] - valid_utts.iloc[i]['end_sec']
-        gaps.append(gap)
-    
-    # 2. Long pauses (> 3 seconds)
-    long_pauses = [g for g in gaps if g > 3.0]
-    long_pauses_count = len(long_pauses)
-    
-    # 3. Interruptions (negative or very small gaps)
-    interruptions = [g for g in gaps if g < 0.5]
-    interruption_rate = len(interruptions) / len(gaps) if len(gaps) > 0 else 0.0
-    
-    # 4. Response delays per speaker
-    agent_response_delays = []
-    customer_response_delays = []
-    
-    for i in range(len(valid_utts) - 1):
-        current_speaker = valid_utts.iloc[i]['speaker']
-        next_speaker = valid_utts.iloc[i + 1]['speaker']
+    gaps = start[1:] - end[:-1]
+    
+    # 2-6. Long pauses, interruptions, monologues and turn counts
+    if NUMBA_AVAILABLE and len(call_arrays) > KERNEL_MIN_UTTERANCES:
+        (long_pauses_count, interruptions_count, monologue_segments,
+         agent_turns, customer_turns) = _interaction_kernel(start, end, speaker_code)
+    else:
+        # Long pauses (> 3 seconds)
+        long_pauses_count = int(np.count_nonzero(gaps > 3.0))
         
-        if current_speaker != next_speaker:  # Speaker switch
-            gap = valid_utts.iloc[i + 1]['start_sec'] - valid_utts.iloc[i]['end_sec']
-            
-            if next_speaker == 'AGENT':
-                agent_response_delays.append(gap)
-            elif next_speaker == 'CUSTOMER':
-                customer_response_delays.append(gap)
-    
-    # 5. Monologue detection (consecutive utterances by same speaker)
-    monologue_segments = 0
-    current_speaker = None
-    consecutive_count = 0
-    
-    for _, row in valid_utts.iterrows():
-        if row['speaker'] == current_speaker:
-            consecutive_count += 1
-        else:
-            if consecutive_count >= 3:  # 3+ consecutive = monologue
-                monologue_segments += 1
-            current_speaker = row['speaker']
-            consecutive_count = 1
+        # Interruptions (negative or very small gaps)
+        interruptions_count = int(np.count_nonzero(gaps < 0.5))
+        
+        # Monologue detection (3+ consecutive utterances by same speaker)
+        run_bounds = np.flatnonzero(np.r_[True, speaker_code[1:] != speaker_code[:-1], True])
+        monologue_segments = int(np.count_nonzero(np.diff(run_bounds) >= 3))
+        
+        # Turn-taking balance (unmapped labels are coded -1 and skipped)
+        speaker_counts = np.bincount(speaker_code[speaker_code >= 0], minlength=len(SPEAKER_CODES))
+        agent_turns = int(speaker_counts[AGENT_CODE])
+        customer_turns = int(speaker_counts[CUSTOMER_CODE])
     
-    # Check last segment
-    if consecutive_count >= 3:
-        monologue_segments += 1
+    interruption_rate = interruptions_count / len(gaps)
     
-    # 6. Turn-taking balance
-    speaker_turns = valid_utts.groupby('speaker').size().to_dict()
-    agent_turns = speaker_turns.get('AGENT', 0)
-    customer_turns = speaker_turns.get('CUSTOMER', 0)
+    # Response delays per speaker (gap before a speaker switch)
+    next_code = speaker_code[1:]
+    switch = next_code != speaker_code[:-1]
+    agent_response_delays = gaps[switch & (next_code == AGENT_CODE)]
+    customer_response_delays = gaps[switch & (next_code == CUSTOMER_CODE)]
     
-    total_turns = agent_turns + customer_turns
     turn_balance = min(agent_turns, customer_turns) / max(agent_turns, customer_turns) if max(agent_turns, customer_turns) > 0 else 0.0
     
     return {
@@ -93,7 +86,7 @@ def compute_interaction_metrics(utterances_df: pd.DataFrame, call_id: str) -> Di
         'long_pauses_rate': long_pauses_count / len(gaps) if len(gaps) > 0 else 0.0,
         
         # Interruptions
-        'interruptions_count': len(interruptions),
+        'interruptions_count': interruptions_count,
         'interruption_rate': interruption_rate,
         
         # Response times
@@ -110,33 +103,85 @@ def compute_interaction_metrics(utterances_df: pd.DataFrame, call_id: str) -> Di
     }
 
 
-def compute_dead_air_time(utterances_df: pd.DataFrame, call_metrics: pd.Series) -> float:
+def compute_dead_air_time(
+    utterances_df: pd.DataFrame,
+    call_metrics: pd.Series,
+    call_arrays: Optional[ValidUtterances] = None
+) -> float:
     """
     Compute total "dead air" time (silence with no speech).
     
     Args:
         utterances_df: DataFrame with utterances for a single call
         call_metrics: Series with call-level metrics (contains silence_time)
+        call_arrays: Pre-built sorted arrays for this call (built if None)
         
     Returns:
         Dead air time in seconds (long silences > 5 seconds)
     """
+    if call_arrays is None:
+        call_arrays = prepare_call_arrays(utterances_df)
     
-    valid_utts = utterances_df[utterances_df['valid_time']].copy()
-    
-    if len(valid_utts) < 2:
+    if len(call_arrays) < 2:
         return 0.0
     
-    valid_utts = valid_utts.sort_values('start_sec')
-    
     # Find gaps longer than 5 seconds (awkward silence)
-    dead_air = 0.0
-    for i in range(len(valid_utts) - 1):
-        gap = valid_utts.iloc[i + 1]['start_sec'] - valid_utts.iloc[i]['end_sec']
-        if gap > 5.0:
-            dead_air += gap
+    gaps = call_arrays.start[1:] - call_arrays.end[:-1]
+    return float(gaps[gaps > 5.0].sum())
+
+
+@njit(cache=True, nogil=True, fastmath=True)
+def _interaction_kernel(
+    start: np.ndarray,
+    end: np.ndarray,
+    speaker_code: np.ndarray
+) -> Tuple[int, int, int, int, int]:
+    """
+    Single-pass counters over time-sorted utterances.
+    
+    Args:
+        start: Start times (sorted)
+        end: End times
+        speaker_code: int8 speaker codes (see SPEAKER_CODES)
+        
+    Returns:
+        (long_pauses, interruptions, monologue_segments, agent_turns, customer_turns)
+    """
+    long_pauses = 0
+    interruptions = 0
+    monologue_segments = 0
+    agent_turns = 0
+    customer_turns = 0
+    run_length = 0
+    
+    for i in range(start.shape[0]):
+        code = speaker_code[i]
+        if code == 0:
+            agent_turns += 1
+        elif code == 1:
+            customer_turns += 1
+        
+        if i == 0:
+            run_length = 1
+            continue
+        
+        gap = start[i] - end[i - 1]
+        if gap > 3.0:
+            long_pauses += 1
+        if gap < 0.5:
+            interruptions += 1
+        
+        if code == speaker_code[i - 1]:
+            run_length += 1
+        else:
+            if run_length >= 3:
+                monologue_segments += 1
+            run_length = 1
+    
+    if run_length >= 3:
+        monologue_segments += 1
     
-    return dead_air
+    return long_pauses, interruptions, monologue_segments, agent_turns, customer_turns
 
 
 def _empty_interaction_metrics(call_id: str) -> Dict[str, Any]:
@@ -1,6 +1,6 @@
 """Metric registry system for extensibility."""
 
-from typing import Dict, Callable, Any, List
+from typing import Dict, Callable, Any, List, Tuple
 from dataclasses import dataclass
 from loguru import logger
 
@@ -13,7 +13,7 @@ class MetricDefinition:
     category: str  # 'call', 'speaker', 'quality'
     compute_func: Callable
     description: str
-    inputs: List[str]
+    inputs: Tuple[str, ...]
     outputs: List[str]
     units: Dict[str, str]
 
@@ -57,7 +57,7 @@ class MetricRegistry:
             category=category,
             compute_func=compute_func,
             description=description,
-            inputs=inputs,
+            inputs=tuple(inputs),
             outputs=outputs,
             units=units or {}
         )
@@ -103,10 +103,13 @@ class MetricRegistry:
         Returns:
             Metric result
         """
-        metric_def = self.get(name)
+        try:
+            metric_def = self._metrics[name]
+        except KeyError:
+            raise KeyError(f"Metric not found: {name}") from None
         
-        # Validate inputs
-        missing = set(metric_def.inputs) - set(kwargs.keys())
+        # Validate inputs (kwargs is a dict, so membership is O(1))
+        missing = [i for i in metric_def.inputs if i not in kwargs]
         if missing:
             raise ValueError(
                 f"Missing required inputs for metric '{name}': {missing}"
@@ -124,19 +127,41 @@ class MetricRegistry:
 # Global registry instance
 _global_registry = MetricRegistry()
 
+# Set once core metrics are in the global registry
+_core_registered = False
+
 
 def get_global_registry() -> MetricRegistry:
     """Get the global metric registry."""
     return _global_registry
 
 
-def register_core_metrics():
-    """Register all core metrics."""
+def register_core_metrics(force: bool = False):
+    """
+    Register all core metrics.
+    
+    Repeated calls (e.g. dashboard reruns) are no-ops, so metrics are not
+    re-registered and no overwrite warnings are logged.
+    
+    Args:
+        force: Register again even if already registered
+    """
+    global _core_registered
+    
+    if _core_registered and not force:
+        return
+    
     from .call_level import compute_call_metrics
     from .speaker_level import compute_speaker_metrics
     from .quality import compute_quality_metrics
     from .text_analysis import compute_text_statistics, compute_filler_words
     from .interaction_patterns import compute_interaction_metrics
+    from .speaker_level import _compute_gini
+    from ..utils.jit import NUMBA_AVAILABLE
+    
+    # Compile the Gini kernel now so the first call does not pay the JIT cost
+    if NUMBA_AVAILABLE:
+        _compute_gini([1.0, 2.0])
     
     registry = get_global_registry()
     
@@ -261,4 +286,6 @@ def register_core_metrics():
         }
     )
     
+    _core_registered = True
+    
     logger.info(f"Registered {len(registry.list_metrics())} core metrics")
@@ -6,6 +6,12 @@ from typing import Dict, List
 from loguru import logger
 
 from .timeline import TimelineCalculator
+from ..utils.jit import njit, NUMBA_AVAILABLE
+
+
+# TimelineCalculator holds only its precision setting, so one instance is
+# shared by all calls (and threads) instead of allocating one per call
+_CALC = TimelineCalculator()
 
 
 def compute_speaker_metrics(
@@ -19,7 +25,8 @@ def compute_speaker_metrics(
     Args:
         call_id: Call identifier
         utterances_df: Utterances for this call
-        timeline_stats: Pre-computed timeline statistics
+        timeline_stats: Pre-computed timeline statistics (optional 'turns'
+            DataFrame from TimelineCalculator.compute_turns_df is reused)
         
     Returns:
         List of speaker metric dictionaries
@@ -30,95 +37,162 @@ def compute_speaker_metrics(
         logger.warning(f"No valid utterances for speaker metrics: {call_id}")
         return []
     
-    speakers = valid_df['speaker'].unique()
-    metrics_list = []
+    # Utterance counts and word totals per speaker (first-appearance order)
+    utt_agg = valid_df.groupby('speaker', sort=False, observed=True)['word_count'].agg(['sum', 'size'])
     
-    # Get apportioned and raw speaking times
-    apportioned = timeline_stats['apportioned']
-    raw_speaking = timeline_stats['raw_speaking']
+    # Single speaker: one turn spanning all valid utterances, Gini is 0
+    if len(utt_agg) == 1:
+        speaker = utt_agg.index[0]
+        return [_single_speaker_record(
+            call_id, speaker, valid_df, timeline_stats,
+            int(utt_agg.at[speaker, 'size']), int(utt_agg.at[speaker, 'sum'])
+        )]
     
-    # Compute turns per speaker
-    calc = TimelineCalculator()
-    turns = calc.compute_turns(utterances_df)
-    turns_df = pd.DataFrame(turns)
-    
-    L = timeline_stats['L']
+    metrics_list = []
     
-    for speaker in speakers:
-        speaker_utts = valid_df[valid_df['speaker'] == speaker]
-        speaker_turns = turns_df[turns_df['speaker'] == speaker] if not turns_df.empty else pd.DataFrame()
-        
-        # Speaking times
-        raw_time = raw_speaking.get(speaker, 0.0)
-        apportioned_time = apportioned.get(speaker, 0.0)
-        
-        # Proportions
-        raw_proportion = (raw_time / L) if L > 0 else 0.0
-        apportioned_proportion = (apportioned_time / L) if L > 0 else 0.0
-        
-        # Turn statistics
-        turn_count = len(speaker_turns)
-        
-        if turn_count > 0:
-            avg_turn_duration = speaker_turns['duration_sec'].mean()
-            max_turn_duration = speaker_turns['duration_sec'].max()
-            avg_utts_per_turn = speaker_turns['utterance_count'].mean()
+    # Turns per speaker (precomputed by the pipeline when available)
+    turns_df = timeline_stats.get('turns')
+    if turns_df is None:
+        turns_df = _CALC.compute_turns_df(utterances_df)
+    
+    # Turn statistics per speaker (no NaNs in turn fields, means are sum / size)
+    if turns_df.empty:
+        turn_agg = pd.DataFrame(columns=['n', 'dur_sum', 'dur_max', 'utts_sum'])
+    else:
+        turn_agg = turns_df.groupby('speaker', sort=False, observed=True).agg(
+            n=('duration_sec', 'size'),
+            dur_sum=('duration_sec', 'sum'),
+            dur_max=('duration_sec', 'max'),
+            utts_sum=('utterance_count', 'sum')
+        )
+    
+    for speaker in utt_agg.index:
+        if speaker in turn_agg.index:
+            turn_count = int(turn_agg.at[speaker, 'n'])
+            avg_turn_duration = float(turn_agg.at[speaker, 'dur_sum'] / turn_count)
+            max_turn_duration = float(turn_agg.at[speaker, 'dur_max'])
+            avg_utts_per_turn = float(turn_agg.at[speaker, 'utts_sum'] / turn_count)
         else:
+            turn_count = 0
             avg_turn_duration = 0.0
             max_turn_duration = 0.0
             avg_utts_per_turn = 0.0
         
-        # Utterance statistics
-        utt_count = len(speaker_utts)
-        total_words = speaker_utts['word_count'].sum()
-        avg_words_per_utt = speaker_utts['word_count'].mean()
-        
-        # Words per minute (using apportioned time)
-        wpm = (total_words / (apportioned_time / 60)) if apportioned_time > 0 else 0.0
-        
-        # Longest monologue (max turn duration)
-        longest_monologue = max_turn_duration
-        
-        metrics = {
-            'call_id': call_id,
-            'speaker': speaker,
-            
-            # Speaking time
-            'raw_speaking_time': raw_time,
-            'apportioned_speaking_time': apportioned_time,
-            'raw_proportion': raw_proportion,
-            'apportioned_proportion': apportioned_proportion,
-            
-            # Turns
-            'turn_count': turn_count,
-            'avg_turn_duration': avg_turn_duration,
-            'max_turn_duration': max_turn_duration,
-            'longest_monologue': longest_monologue,
-            'avg_utts_per_turn': avg_utts_per_turn,
-            
-            # Utterances
-            'utterance_count': utt_count,
-            'total_words': total_words,
-            'avg_words_per_utt': avg_words_per_utt,
-            
-            # Speech rate
-            'words_per_minute': wpm
-        }
-        
-        metrics_list.append(metrics)
+        metrics_list.append(_speaker_record(
+            call_id,
+            speaker,
+            timeline_stats,
+            turn_count,
+            avg_turn_duration,
+            max_turn_duration,
+            avg_utts_per_turn,
+            int(utt_agg.at[speaker, 'size']),
+            int(utt_agg.at[speaker, 'sum'])
+        ))
     
     # Compute dialog balance (Gini coefficient on apportioned times)
-    gini = _compute_gini(list(apportioned.values()))
+    gini = _compute_gini(list(timeline_stats['apportioned'].values()))
     
     # Add Gini to all speaker records (call-level stat)
     for m in metrics_list:
         m['dialog_balance_gini'] = gini
     
-    logger.debug(f"Computed metrics for {len(metrics_list)} speakers in {call_id}")
+    logger.debug("Computed metrics for {} speakers in {}", len(metrics_list), call_id)
     
     return metrics_list
 
 
+def _single_speaker_record(
+    call_id: str,
+    speaker: str,
+    valid_df: pd.DataFrame,
+    timeline_stats: Dict,
+    utt_count: int,
+    total_words: int
+) -> Dict:
+    """
+    Speaker record for a call with one valid speaker, without computing turns.
+    
+    All valid utterances form a single turn from the first utterance's start
+    to the latest end.
+    """
+    first = valid_df['utterance_index'].to_numpy().argmin()
+    turn_duration = valid_df['end_sec'].max() - valid_df['start_sec'].iloc[first]
+    
+    metrics = _speaker_record(
+        call_id,
+        speaker,
+        timeline_stats,
+        1,
+        turn_duration,
+        turn_duration,
+        float(utt_count),
+        utt_count,
+        total_words
+    )
+    metrics['dialog_balance_gini'] = 0.0
+    
+    return metrics
+
+
+def _speaker_record(
+    call_id: str,
+    speaker: str,
+    timeline_stats: Dict,
+    turn_count: int,
+    avg_turn_duration: float,
+    max_turn_duration: float,
+    avg_utts_per_turn: float,
+    utt_count: int,
+    total_words: int
+) -> Dict:
+    """Build one speaker's metrics record (without the call-level Gini)."""
+    L = timeline_stats['L']
+    
+    # Speaking times
+    raw_time = timeline_stats['raw_speaking'].get(speaker, 0.0)
+    apportioned_time = timeline_stats['apportioned'].get(speaker, 0.0)
+    
+    # Proportions
+    raw_proportion = (raw_time / L) if L > 0 else 0.0
+    apportioned_proportion = (apportioned_time / L) if L > 0 else 0.0
+    
+    # Utterance statistics
+    avg_words_per_utt = float(total_words / utt_count) if utt_count else 0.0
+    
+    # Words per minute (using apportioned time)
+    wpm = (total_words / (apportioned_time / 60)) if apportioned_time > 0 else 0.0
+    
+    # Longest monologue (max turn duration)
+    longest_monologue = max_turn_duration
+    
+    return {
+        'call_id': call_id,
+        'speaker': speaker,
+        
+        # Speaking time
+        'raw_speaking_time': raw_time,
+        'apportioned_speaking_time': apportioned_time,
+        'raw_proportion': raw_proportion,
+        'apportioned_proportion': apportioned_proportion,
+        
+        # Turns
+        'turn_count': turn_count,
+        'avg_turn_duration': avg_turn_duration,
+        'max_turn_duration': max_turn_duration,
+        'longest_monologue': longest_monologue,
+        'avg_utts_per_turn': avg_utts_per_turn,
+        
+        # Utterances
+        'utterance_count': utt_count,
+        'total_words': total_words,
+        'avg_words_per_utt': avg_words_per_utt,
+        
+        # Speech rate
+        'words_per_minute': wpm
+    }
+
+
 def _compute_gini(values: List[float]) -> float:
     """
     Compute Gini coefficient for dialog balance.
@@ -137,20 +211,33 @@ def _compute_gini(values: List[float]) -> float:
         return 0.0
     
     # Remove zeros and sort
-    values = [v for v in values if v > 0]
-    if len(values) < 2:
+    vals = np.asarray([v for v in values if v > 0], dtype=np.float64)
+    if vals.size < 2:
         return 0.0
     
-    values = sorted(values)
-    n = len(values)
+    if NUMBA_AVAILABLE:
+        return float(_gini_kernel(vals))
     
-    # Gini formula: G = (2 * Σ(i * x_i)) / (n * Σ(x_i)) - (n + 1) / n
-    cumsum = 0
-    for i, val in enumerate(values, start=1):
-        cumsum += i * val
+    vals.sort()
+    n = vals.size
     
-    total = sum(values)
-    
-    gini = (2 * cumsum) / (n * total) - (n + 1) / n
+    # Gini formula: G = (2 * Σ(i * x_i)) / (n * Σ(x_i)) - (n + 1) / n
+    idx = np.arange(1, n + 1, dtype=np.float64)
+    gini = (2.0 * (idx @ vals)) / (n * vals.sum()) - (n + 1) / n
     
-    return gini
+    return float(gini)
+
+
+@njit(cache=True, nogil=True)
+def _gini_kernel(vals):
+    """Gini of positive values (sorted in place), fused sort + weighted sum."""
+    vals.sort()
+    n = vals.shape[0]
+    
+    weighted = 0.0
+    total = 0.0
+    for i in range(n):
+        weighted += (i + 1) * vals[i]
+        total += vals[i]
+    
+    return (2.0 * weighted) / (n * total) - (n + 1) / n
@@ -5,6 +5,17 @@ import re
 from typing import Dict, Any
 from loguru import logger
 
+from ._preprocess import (
+    text_stripped_len, encode_speakers, sum_by_speaker, AGENT_CODE, CUSTOMER_CODE
+)
+from ._text_pass import (
+    ensure_text_pass, WORDS_LOWER, QUESTION_N, EXCLAMATION_N, FILLER_N, WORD_N
+)
+
+
+# Sentence boundaries (runs of terminal punctuation)
+_SENT_SPLIT_RE = re.compile(r'[.!?]+')
+
 
 def compute_text_statistics(utterances_df: pd.DataFrame, call_id: str) -> Dict[str, Any]:
     """
@@ -18,26 +29,27 @@ def compute_text_statistics(utterances_df: pd.DataFrame, call_id: str) -> Dict[s
         Dictionary with text statistics metrics
     """
     
+    # Per-utterance counts from the shared text pass
+    utterances_df = ensure_text_pass(utterances_df)
+    
     # Filter valid utterances with text
-    valid_utts = utterances_df[
-        (utterances_df['valid_time']) & 
-        (utterances_df['text'].notna()) &
-        (utterances_df['text'].str.strip() != '')
-    ].copy()
+    has_text = utterances_df['valid_time'] & (text_stripped_len(utterances_df) > 0)
+    valid_utts = utterances_df.loc[has_text]
     
     if len(valid_utts) == 0:
         logger.warning(f"No valid utterances with text for call {call_id}")
         return _empty_text_stats(call_id)
     
-    # Combine all text
-    all_text = ' '.join(valid_utts['text'].astype(str))
+    # Combine all text (sentences may span utterances); rows with text
+    # are strings already, so no astype pass is needed
+    all_text = ' '.join(valid_utts['text'].to_numpy())
     
     # 1. Word statistics
-    words = all_text.split()
-    unique_words = set(w.lower() for w in words if len(w) > 0)
+    total_words = int(valid_utts[WORD_N].sum())
+    unique_words = set(' '.join(valid_utts[WORDS_LOWER]).split())
     
     # 2. Sentence statistics
-    sentences = re.split(r'[.!?]+', all_text)
+    sentences = _SENT_SPLIT_RE.split(all_text)
     sentences = [s.strip() for s in sentences if s.strip()]
     
     if len(sentences) > 0:
@@ -47,28 +59,20 @@ def compute_text_statistics(utterances_df: pd.DataFrame, call_id: str) -> Dict[s
         avg_sentence_length = 0.0
     
     # 3. Punctuation counts
-    question_count = all_text.count('?')
-    exclamation_count = all_text.count('!')
+    question_count = int(valid_utts[QUESTION_N].sum())
+    exclamation_count = int(valid_utts[EXCLAMATION_N].sum())
     
     # 4. Vocabulary richness (Type-Token Ratio)
-    vocabulary_richness = len(unique_words) / len(words) if len(words) > 0 else 0.0
-    
-    # 5. Per-speaker statistics
-    speaker_stats = {}
-    for speaker in valid_utts['speaker'].unique():
-        speaker_utts = valid_utts[valid_utts['speaker'] == speaker]
-        speaker_text = ' '.join(speaker_utts['text'].astype(str))
-        speaker_words = speaker_text.split()
-        
-        speaker_stats[speaker] = {
-            'unique_words': len(set(w.lower() for w in speaker_words)),
-            'question_count': speaker_text.count('?'),
-            'exclamation_count': speaker_text.count('!')
-        }
+    vocabulary_richness = len(unique_words) / total_words if total_words > 0 else 0.0
+    
+    # 5. Per-speaker statistics (speaker encoded once, summed by code)
+    speaker_code = encode_speakers(valid_utts['speaker'])
+    speaker_questions = sum_by_speaker(speaker_code, valid_utts[QUESTION_N].to_numpy())
+    speaker_exclamations = sum_by_speaker(speaker_code, valid_utts[EXCLAMATION_N].to_numpy())
     
     return {
         'call_id': call_id,
-        'total_words': len(words),
+        'total_words': total_words,
         'unique_words_count': len(unique_words),
         'vocabulary_richness': vocabulary_richness,
         'sentence_count': len(sentences),
@@ -76,10 +80,10 @@ def compute_text_statistics(utterances_df: pd.DataFrame, call_id: str) -> Dict[s
         'question_count': question_count,
         'exclamation_count': exclamation_count,
         'questions_per_utterance': question_count / len(valid_utts) if len(valid_utts) > 0 else 0.0,
-        'agent_questions': speaker_stats.get('AGENT', {}).get('question_count', 0),
-        'customer_questions': speaker_stats.get('CUSTOMER', {}).get('question_count', 0),
-        'agent_exclamations': speaker_stats.get('AGENT', {}).get('exclamation_count', 0),
-        'customer_exclamations': speaker_stats.get('CUSTOMER', {}).get('exclamation_count', 0)
+        'agent_questions': int(speaker_questions[AGENT_CODE]),
+        'customer_questions': int(speaker_questions[CUSTOMER_CODE]),
+        'agent_exclamations': int(speaker_exclamations[AGENT_CODE]),
+        'customer_exclamations': int(speaker_exclamations[CUSTOMER_CODE])
     }
 
 
@@ -95,18 +99,13 @@ def compute_filler_words(utterances_df: pd.DataFrame, call_id: str) -> Dict[str,
         Dictionary with filler word metrics
     """
     
-    # Czech filler words
-    fillers = [
-        'ehm', 'em', 'hm', 'hmm', 'aha', 'ano', 'eh', 'uh', 'um',
-        'jako', 'jakoby', 'vlastně', 'víš', 'víte', 'teda', 'prostě',
-        'tak', 'takže', 'no', 'jo', 'ježiš', 'kruci'
-    ]
+    # Per-utterance counts from the shared text pass
+    utterances_df = ensure_text_pass(utterances_df)
     
-    valid_utts = utterances_df[
-        (utterances_df['valid_time']) & 
-        (utterances_df['text'].notna()) &
-        (utterances_df['text'].str.strip() != '')
-    ].copy()
+    valid_utts = utterances_df.loc[
+        utterances_df['valid_time'] &
+        (text_stripped_len(utterances_df) > 0)
+    ]
     
     if len(valid_utts) == 0:
         return {
@@ -117,28 +116,25 @@ def compute_filler_words(utterances_df: pd.DataFrame, call_id: str) -> Dict[str,
             'customer_filler_rate': 0.0
         }
     
-    all_text = ' '.join(valid_utts['text'].astype(str).str.lower())
-    words = all_text.split()
+    word_count = int(valid_utts[WORD_N].sum())
     
     # Count filler words
-    filler_count = sum(1 for word in words if word in fillers)
-    filler_rate = filler_count / len(words) if len(words) > 0 else 0.0
-    
-    # Per-speaker filler rates
-    agent_utts = valid_utts[valid_utts['speaker'] == 'AGENT']
-    customer_utts = valid_utts[valid_utts['speaker'] == 'CUSTOMER']
+    filler_count = int(valid_utts[FILLER_N].sum())
+    filler_rate = filler_count / word_count if word_count > 0 else 0.0
     
-    agent_text = ' '.join(agent_utts['text'].astype(str).str.lower()) if len(agent_utts) > 0 else ''
-    customer_text = ' '.join(customer_utts['text'].astype(str).str.lower()) if len(customer_utts) > 0 else ''
+    # Per-speaker filler rates (speaker encoded once, summed by code)
+    speaker_code = encode_speakers(valid_utts['speaker'])
+    speaker_words = sum_by_speaker(speaker_code, valid_utts[WORD_N].to_numpy())
+    speaker_fillers = sum_by_speaker(speaker_code, valid_utts[FILLER_N].to_numpy())
     
-    agent_words = agent_text.split()
-    customer_words = customer_text.split()
+    agent_word_count = int(speaker_words[AGENT_CODE])
+    customer_word_count = int(speaker_words[CUSTOMER_CODE])
     
-    agent_fillers = sum(1 for w in agent_words if w in fillers)
-    customer_fillers = sum(1 for w in customer_words if w in fillers)
+    agent_fillers = int(speaker_fillers[AGENT_CODE])
+    customer_fillers = int(speaker_fillers[CUSTOMER_CODE])
     
-    agent_filler_rate = agent_fillers / len(agent_words) if len(agent_words) > 0 else 0.0
-    customer_filler_rate = customer_fillers / len(customer_words) if len(customer_words) > 0 else 0.0
+    agent_filler_rate = agent_fillers / agent_word_count if agent_word_count > 0 else 0.0
+    customer_filler_rate = customer_fillers / customer_word_count if customer_word_count > 0 else 0.0
     
     return {
         'call_id': call_id,
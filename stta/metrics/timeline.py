@@ -13,11 +13,22 @@ Mathematical guarantees:
 - Σ A_k = L (apportioned sum equals total speech)
 """
 
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Tuple
-from collections import defaultdict
 from loguru import logger
 
+from ._preprocess import KERNEL_MIN_UTTERANCES, SPEAKER_DTYPE
+from ..utils.jit import njit, NUMBA_AVAILABLE
+
+
+# Calls with more valid utterances than this use the NumPy sweep; below it
+# the plain event loop is cheaper than building the arrays
+SWEEP_VECTOR_MIN_UTTERANCES = 48
+
+# Columns of TimelineCalculator.compute_turns_df
+TURN_COLUMNS = ['speaker', 'start_sec', 'end_sec', 'duration_sec', 'utterance_count']
+
 
 class TimelineCalculator:
     """Sweep-line algorithm for interval algebra."""
@@ -55,7 +66,7 @@ class TimelineCalculator:
                 - raw_speaking: {speaker: raw_seconds}
         """
         # Filter valid utterances
-        valid_df = utterances_df[utterances_df['valid_time']].copy()
+        valid_df = utterances_df[utterances_df['valid_time']]
         
         if valid_df.empty:
             logger.warning("No valid utterances for timeline calculation")
@@ -68,61 +79,29 @@ class TimelineCalculator:
                 'raw_speaking': {}
             }
         
+        start = valid_df['start_sec'].to_numpy(dtype=np.float64)
+        end = valid_df['end_sec'].to_numpy(dtype=np.float64)
+        
         # Calculate timeline bounds
-        T = valid_df['end_sec'].max() - valid_df['start_sec'].min()
-        
-        # Create events list: (time, delta, speaker)
-        # delta = +1 for start, -1 for end
-        events = []
-        for _, row in valid_df.iterrows():
-            events.append((row['start_sec'], +1, row['speaker']))
-            events.append((row['end_sec'], -1, row['speaker']))
-        
-        # Sort events
-        # For same time: process start (+1) before end (-1) to handle touching intervals
-        events.sort(key=lambda x: (x[0], -x[1]))
-        
-        # Sweep through events
-        active_speakers = defaultdict(int)  # speaker -> count of active segments
-        last_t = None
-        
-        L = 0.0  # Total speech
-        O = 0.0  # Overlap
-        apportioned = defaultdict(float)  # Fair speaking time
-        
-        for t, delta, speaker in events:
-            # Process segment [last_t, t) if exists
-            if last_t is not None and t > last_t:
-                duration = t - last_t
-                
-                # Count active speakers (those with count > 0)
-                active_count = sum(1 for cnt in active_speakers.values() if cnt > 0)
-                
-                if active_count >= 1:
-                    L += duration
-                    
-                    # Apportion time fairly among active speakers
-                    share = 1.0 / active_count
-                    for spk, cnt in active_speakers.items():
-                        if cnt > 0:
-                            apportioned[spk] += duration * share
-                
-                if active_count >= 2:
-                    O += duration
-            
-            # Update active speakers
-            active_speakers[speaker] += delta
-            last_t = t
+        T = end.max() - start.min()
         
-        # Calculate silence
-        S = max(0.0, T - L)
+        # Sweep through start/end events
+        if NUMBA_AVAILABLE and len(valid_df) > KERNEL_MIN_UTTERANCES:
+            L, O, apportioned = _sweep_compiled(start, end, valid_df['speaker'])
+        elif len(valid_df) > SWEEP_VECTOR_MIN_UTTERANCES:
+            L, O, apportioned = _sweep_arrays(start, end, valid_df['speaker'])
+        else:
+            L, O, apportioned = _sweep_events(start, end, valid_df['speaker'])
+        
+        # Calculate silence; float residuals of the sweep sums (|T - L| ~ 1e-14)
+        # are snapped to 0 so fully covered calls report no silence
+        S = T - L if T - L > 1e-9 else 0.0
         
         # Calculate raw speaking time (with overlaps double-counted)
-        raw_speaking = defaultdict(float)
-        for _, row in valid_df.iterrows():
-            raw_speaking[row['speaker']] += row['duration_sec']
+        raw_speaking = valid_df.groupby('speaker', sort=False, observed=True)['duration_sec'].sum().to_dict()
         
-        logger.debug(f"Timeline: T={T:.2f}s, L={L:.2f}s, O={O:.2f}s, S={S:.2f}s")
+        # Arguments are only formatted if DEBUG is enabled
+        logger.debug("Timeline: T={:.2f}s, L={:.2f}s, O={:.2f}s, S={:.2f}s", T, L, O, S)
         
         # Validate invariants
         self._validate_invariants(T, L, O, S, apportioned)
@@ -133,7 +112,7 @@ class TimelineCalculator:
             'O': O,
             'S': S,
             'apportioned': dict(apportioned),
-            'raw_speaking': dict(raw_speaking)
+            'raw_speaking': raw_speaking
         }
     
     def _validate_invariants(
@@ -173,33 +152,45 @@ class TimelineCalculator:
             utterances_df: DataFrame sorted by start_sec
             
         Returns:
-            List of gap dicts with keys:
+            List of gap dicts (see compute_gaps_df for the keys)
+        """
+        return self.compute_gaps_df(utterances_df).to_dict('records')
+    
+    def compute_gaps_df(
+        self,
+        utterances_df: pd.DataFrame
+    ) -> pd.DataFrame:
+        """
+        Compute gaps between consecutive utterances as a DataFrame.
+        
+        Args:
+            utterances_df: DataFrame sorted by start_sec
+            
+        Returns:
+            DataFrame with one row per gap and columns:
                 - gap_sec: gap duration (can be negative for overlaps)
                 - prev_end: previous utterance end time
                 - next_start: next utterance start time
                 - prev_speaker: previous speaker
                 - next_speaker: next speaker
         """
-        valid_df = utterances_df[utterances_df['valid_time']].copy()
-        valid_df = valid_df.sort_values('start_sec').reset_index(drop=True)
+        valid_df = utterances_df[utterances_df['valid_time']]
+        if not valid_df['start_sec'].is_monotonic_increasing:
+            valid_df = valid_df.sort_values('start_sec')
         
-        gaps = []
+        start = valid_df['start_sec'].to_numpy()
+        end = valid_df['end_sec'].to_numpy()
+        speaker = valid_df['speaker'].to_numpy()
         
-        for i in range(len(valid_df) - 1):
-            curr = valid_df.iloc[i]
-            next_utt = valid_df.iloc[i + 1]
-            
-            gap_sec = next_utt['start_sec'] - curr['end_sec']
-            
-            gaps.append({
-                'gap_sec': gap_sec,
-                'prev_end': curr['end_sec'],
-                'next_start': next_utt['start_sec'],
-                'prev_speaker': curr['speaker'],
-                'next_speaker': next_utt['speaker']
-            })
-        
-        return gaps
+        # Gaps are only between neighbours in start order, so one diff over
+        # the sorted arrays is enough; no interval (overlap) queries needed
+        return pd.DataFrame({
+            'gap_sec': start[1:] - end[:-1],
+            'prev_end': end[:-1],
+            'next_start': start[1:],
+            'prev_speaker': speaker[:-1],
+            'next_speaker': speaker[1:]
+        })
     
     def compute_turns(
         self,
@@ -215,56 +206,289 @@ class TimelineCalculator:
             utterances_df: DataFrame sorted by utterance_index
             
         Returns:
-            List of turn dicts with keys:
+            List of turn dicts (see compute_turns_df for the keys)
+        """
+        return self.compute_turns_df(utterances_df).to_dict('records')
+    
+    def compute_turns_df(
+        self,
+        utterances_df: pd.DataFrame
+    ) -> pd.DataFrame:
+        """
+        Compute speaker turns as a DataFrame, one row per turn.
+        
+        Args:
+            utterances_df: DataFrame sorted by utterance_index
+            
+        Returns:
+            DataFrame with columns:
                 - speaker: speaker label
                 - start_sec: turn start time
                 - end_sec: turn end time
                 - duration_sec: turn duration
                 - utterance_count: number of utterances in turn
         """
-        valid_df = utterances_df[utterances_df['valid_time']].copy()
-        valid_df = valid_df.sort_values('utterance_index').reset_index(drop=True)
+        valid_df = utterances_df[utterances_df['valid_time']]
         
         if valid_df.empty:
-            return []
+            return pd.DataFrame(columns=TURN_COLUMNS)
         
-        turns = []
-        current_speaker = valid_df.iloc[0]['speaker']
-        turn_start = valid_df.iloc[0]['start_sec']
-        turn_end = valid_df.iloc[0]['end_sec']
-        utt_count = 1
+        start = valid_df['start_sec'].to_numpy()
+        end = valid_df['end_sec'].to_numpy()
+        speaker = valid_df['speaker'].to_numpy()
         
-        for i in range(1, len(valid_df)):
-            row = valid_df.iloc[i]
-            
-            if row['speaker'] == current_speaker:
-                # Continue current turn
-                turn_end = max(turn_end, row['end_sec'])
-                utt_count += 1
-            else:
-                # End current turn, start new one
-                turns.append({
-                    'speaker': current_speaker,
-                    'start_sec': turn_start,
-                    'end_sec': turn_end,
-                    'duration_sec': turn_end - turn_start,
-                    'utterance_count': utt_count
-                })
-                
-                current_speaker = row['speaker']
-                turn_start = row['start_sec']
-                turn_end = row['end_sec']
-                utt_count = 1
-        
-        # Add final turn
-        turns.append({
-            'speaker': current_speaker,
+        # utterance_index is normally already increasing; sort only the
+        # three arrays (not the frame) when it is not
+        utt_index = valid_df['utterance_index'].to_numpy()
+        if not (np.diff(utt_index) >= 0).all():
+            order = np.argsort(utt_index, kind='stable')
+            start, end, speaker = start[order], end[order], speaker[order]
+        
+        # Turn boundaries: first utterance and every speaker change
+        bounds = np.flatnonzero(np.r_[True, speaker[1:] != speaker[:-1]])
+        turn_start = start[bounds]
+        turn_end = np.maximum.reduceat(end, bounds)
+        
+        turns_df = pd.DataFrame({
+            'speaker': speaker[bounds],
             'start_sec': turn_start,
             'end_sec': turn_end,
             'duration_sec': turn_end - turn_start,
-            'utterance_count': utt_count
+            'utterance_count': np.diff(np.r_[bounds, len(speaker)])
         })
         
-        logger.debug(f"Computed {len(turns)} turns")
+        logger.debug("Computed {} turns", len(turns_df))
+        
+        return turns_df
+
+def _sweep_events(
+    start: np.ndarray,
+    end: np.ndarray,
+    speakers
+) -> Tuple[float, float, Dict[str, float]]:
+    """
+    Event-loop sweep over utterance intervals (reference implementation).
+    
+    Speakers are mapped to slots 0..K-1 so the active counts and
+    apportioned times are plain lists indexed by slot.
+    
+    Args:
+        start: Interval start times
+        end: Interval end times
+        speakers: Speaker label per interval
+        
+    Returns:
+        (L speech time, O overlap time, apportioned time per speaker)
+    """
+    codes, labels = _speaker_codes(speakers)
+    n_speakers = len(labels)
+    
+    # Create events list: (time, -delta, interval index, speaker slot)
+    # delta = +1 for start, -1 for end; stored negated so that the default
+    # tuple order sorts starts first, and the index keeps ties in input
+    # order
+    events = []
+    for i, (s, e, k) in enumerate(zip(start.tolist(), end.tolist(), codes.tolist())):
+        events.append((s, -1, i, k))
+        events.append((e, +1, i, k))
+    
+    # Sort events (no key function)
+    # For same time: process start (+1) before end (-1) to handle touching intervals
+    events.sort()
+    
+    # Sweep through events
+    active_speakers = [0] * n_speakers  # slot -> count of active segments
+    active_count = 0  # slots with count > 0, updated per event
+    last_t = None
+    
+    L = 0.0  # Total speech
+    O = 0.0  # Overlap
+    apportioned = [0.0] * n_speakers  # Fair speaking time
+    
+    for t, neg_delta, _, k in events:
+        # Process segment [last_t, t) if exists
+        if last_t is not None and t > last_t:
+            duration = t - last_t
+            
+            if active_count >= 1:
+                L += duration
+                
+                # Apportion time fairly among active speakers
+                share = 1.0 / active_count
+                for slot in range(n_speakers):
+                    if active_speakers[slot] > 0:
+                        apportioned[slot] += duration * share
+            
+            if active_count >= 2:
+                O += duration
         
-        return turns
+        # Update active speakers (count changes only on 0 <-> 1 transitions)
+        was_active = active_speakers[k] > 0
+        active_speakers[k] -= neg_delta
+        is_active = active_speakers[k] > 0
+        if is_active and not was_active:
+            active_count += 1
+        elif was_active and not is_active:
+            active_count -= 1
+        last_t = t
+    
+    return L, O, {
+        labels[slot]: apportioned[slot]
+        for slot in range(n_speakers)
+        if apportioned[slot] > 0
+    }
+
+
+def _speaker_codes(speakers) -> Tuple[np.ndarray, pd.Index]:
+    """
+    Map speaker labels to slots 0..K-1.
+    
+    Returns:
+        (code per interval, label per slot)
+    """
+    if speakers.dtype == SPEAKER_DTYPE:
+        # Fixed categories: reuse the codes instead of hashing labels
+        # (Categorical.codes is a plain array, no Series wrapper)
+        categorical = speakers.array
+        return categorical.codes, categorical.categories
+    return pd.factorize(speakers)
+
+
+def _sorted_events(
+    start: np.ndarray,
+    end: np.ndarray,
+    speakers: pd.Series
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, pd.Index]:
+    """
+    Build start/end events as arrays sorted for the sweep.
+    
+    Returns:
+        (times, deltas, speaker codes, speaker labels); for the same time,
+        starts (+1) come before ends (-1) to handle touching intervals
+    """
+    codes, labels = _speaker_codes(speakers)
+    n = len(start)
+    
+    times = np.concatenate([start, end])
+    deltas = np.concatenate([np.ones(n, dtype=np.int32), -np.ones(n, dtype=np.int32)])
+    event_codes = np.concatenate([codes, codes]).astype(np.int32)
+    
+    order = np.lexsort((-deltas, times))
+    
+    return times[order], deltas[order], event_codes[order], labels
+
+
+def _sweep_arrays(
+    start: np.ndarray,
+    end: np.ndarray,
+    speakers: pd.Series
+) -> Tuple[float, float, Dict[str, float]]:
+    """
+    Vectorized sweep: same result as _sweep_events without a per-event loop.
+    
+    Events are sorted once with lexsort; per-speaker active counts after each
+    event are a cumulative sum of one-hot deltas (2N x K, K = speakers).
+    
+    Args:
+        start: Interval start times
+        end: Interval end times
+        speakers: Speaker label per interval
+        
+    Returns:
+        (L speech time, O overlap time, apportioned time per speaker)
+    """
+    times, deltas, event_codes, labels = _sorted_events(start, end, speakers)
+    n = len(start)
+    
+    # Active segment count per speaker after each event
+    per_speaker = np.zeros((2 * n, len(labels)), dtype=np.int32)
+    per_speaker[np.arange(2 * n), event_codes] = deltas
+    active = np.cumsum(per_speaker, axis=0)[:-1] > 0
+    
+    # Segments [t_i, t_i+1) between consecutive events
+    duration = np.diff(times)
+    active_count = active.sum(axis=1)
+    speaking = (duration > 0) & (active_count >= 1)
+    
+    L = float(duration[speaking].sum())
+    O = float(duration[speaking & (active_count >= 2)].sum())
+    
+    # Apportion time fairly among active speakers: one (2N-1) x K product
+    # of per-segment shares with the active mask, no per-speaker loop
+    share = np.zeros_like(duration)
+    share[speaking] = duration[speaking] * (1.0 / active_count[speaking])
+    active = active & speaking[:, None]
+    apportioned_arr = share @ active.astype(np.float64)
+    has_time = active.any(axis=0)
+    
+    apportioned = {
+        labels[k]: float(apportioned_arr[k])
+        for k in np.flatnonzero(has_time).tolist()
+    }
+    
+    return L, O, apportioned
+
+
+def _sweep_compiled(
+    start: np.ndarray,
+    end: np.ndarray,
+    speakers: pd.Series
+) -> Tuple[float, float, Dict[str, float]]:
+    """
+    Sweep with the Numba kernel (O(K) memory instead of O(N x K)).
+    
+    Args:
+        start: Interval start times
+        end: Interval end times
+        speakers: Speaker label per interval
+        
+    Returns:
+        (L speech time, O overlap time, apportioned time per speaker)
+    """
+    times, deltas, event_codes, labels = _sorted_events(start, end, speakers)
+    
+    L, O, apportioned_arr, has_time = _sweep_kernel(times, deltas, event_codes, len(labels))
+    
+    apportioned = {
+        labels[k]: float(apportioned_arr[k])
+        for k in range(len(labels))
+        if has_time[k]
+    }
+    
+    return float(L), float(O), apportioned
+
+
+@njit(cache=True, nogil=True)
+def _sweep_kernel(times, deltas, event_codes, n_speakers):
+    """Event loop over sorted events, keeping the active speaker count incrementally."""
+    active = np.zeros(n_speakers, dtype=np.int32)
+    apportioned = np.zeros(n_speakers, dtype=np.float64)
+    has_time = np.zeros(n_speakers, dtype=np.bool_)
+    active_count = 0
+    
+    L = 0.0
+    O = 0.0
+    
+    for i in range(times.shape[0]):
+        if i > 0 and times[i] > times[i - 1] and active_count >= 1:
+            duration = times[i] - times[i - 1]
+            L += duration
+            if active_count >= 2:
+                O += duration
+            
+            share = duration * (1.0 / active_count)
+            for k in range(n_speakers):
+                if active[k] > 0:
+                    apportioned[k] += share
+                    has_time[k] = True
+        
+        # Update active speakers (count changes only on 0 <-> 1 transitions)
+        k = event_codes[i]
+        before = active[k]
+        active[k] = before + deltas[i]
+        if before == 0 and active[k] > 0:
+            active_count += 1
+        elif before > 0 and active[k] == 0:
+            active_count -= 1
+    
+    return L, O, apportioned, has_time
@@ -8,17 +8,93 @@ Generates professional PDF reports with:
 - Narrative text
 """
 
-from reportlab.lib.pagesizes import A4
-from reportlab.lib import colors
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_CENTER, TA_LEFT
+import hashlib
+import io
+import os
 import pandas as pd
+from collections import OrderedDict
+from functools import cache
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List
-import plotly.graph_objects as go
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Dict, Optional
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+
+# Rendered PNG bytes by figure content hash, so a chart shared by several
+# reports is rendered once (LRU, bounded)
+PNG_CACHE_SIZE = 64
+_png_cache: "OrderedDict[str, bytes]" = OrderedDict()
+
+
+@cache
+def _reportlab() -> SimpleNamespace:
+    """
+    Import ReportLab on first use.
+    
+    ReportLab and Plotly are heavy imports, so they are deferred until a
+    report is built instead of paid by every importer of this module.
+    This only matters to code that imports stta.report.pdf; the CLI does
+    not.
+    """
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib import colors
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.enums import TA_CENTER, TA_LEFT
+    
+    return SimpleNamespace(
+        A4=A4, colors=colors, inch=inch,
+        SimpleDocTemplate=SimpleDocTemplate, Table=Table, TableStyle=TableStyle,
+        Paragraph=Paragraph, Spacer=Spacer, PageBreak=PageBreak, Image=Image,
+        getSampleStyleSheet=getSampleStyleSheet, ParagraphStyle=ParagraphStyle,
+        TA_CENTER=TA_CENTER, TA_LEFT=TA_LEFT
+    )
+
+
+@cache
+def _stylesheet():
+    """
+    Build the report stylesheet once per process.
+    
+    Generators only look styles up, so one sample stylesheet with the
+    custom styles added is shared by all reports.
+    """
+    rl = _reportlab()
+    styles = rl.getSampleStyleSheet()
+    
+    # Title style
+    styles.add(rl.ParagraphStyle(
+        name='CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        textColor=rl.colors.HexColor('#2E86AB'),
+        spaceAfter=12,
+        alignment=rl.TA_CENTER
+    ))
+    
+    # Section header
+    styles.add(rl.ParagraphStyle(
+        name='SectionHeader',
+        parent=styles['Heading2'],
+        fontSize=16,
+        textColor=rl.colors.HexColor('#2E86AB'),
+        spaceAfter=12,
+        spaceBefore=12
+    ))
+    
+    # KPI style
+    styles.add(rl.ParagraphStyle(
+        name='KPI',
+        parent=styles['Normal'],
+        fontSize=12,
+        spaceAfter=6
+    ))
+    
+    return styles
 
 
 class PDFReportGenerator:
@@ -31,198 +107,194 @@ class PDFReportGenerator:
         Args:
             output_path: Path to output PDF file
         """
+        self._rl = rl = _reportlab()
         self.output_path = output_path
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Create document
-        self.doc = SimpleDocTemplate(
+        self.doc = rl.SimpleDocTemplate(
             str(output_path),
-            pagesize=A4,
-            rightMargin=0.75*inch,
-            leftMargin=0.75*inch,
-            topMargin=1*inch,
-            bottomMargin=0.75*inch
+            pagesize=rl.A4,
+            rightMargin=0.75*rl.inch,
+            leftMargin=0.75*rl.inch,
+            topMargin=1*rl.inch,
+            bottomMargin=0.75*rl.inch
         )
         
-        # Styles
-        self.styles = getSampleStyleSheet()
-        self._setup_styles()
+        # Styles (shared, read-only)
+        self.styles = _stylesheet()
         
         # Story (content elements)
         self.story = []
     
-    def _setup_styles(self):
-        """Setup custom paragraph styles."""
-        
-        # Title style
-        self.styles.add(ParagraphStyle(
-            name='CustomTitle',
-            parent=self.styles['Heading1'],
-            fontSize=24,
-            textColor=colors.HexColor('#2E86AB'),
-            spaceAfter=12,
-            alignment=TA_CENTER
-        ))
-        
-        # Section header
-        self.styles.add(ParagraphStyle(
-            name='SectionHeader',
-            parent=self.styles['Heading2'],
-            fontSize=16,
-            textColor=colors.HexColor('#2E86AB'),
-            spaceAfter=12,
-            spaceBefore=12
-        ))
-        
-        # KPI style
-        self.styles.add(ParagraphStyle(
-            name='KPI',
-            parent=self.styles['Normal'],
-            fontSize=12,
-            spaceAfter=6
-        ))
-    
     def add_title(self, call_id: str):
         """Add report title."""
-        title = Paragraph(
+        rl = self._rl
+        title = rl.Paragraph(
             f"Call Analytics Report<br/>{call_id}",
             self.styles['CustomTitle']
         )
         self.story.append(title)
         
         # Timestamp
-        timestamp = Paragraph(
+        timestamp = rl.Paragraph(
             f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
             self.styles['Normal']
         )
         self.story.append(timestamp)
-        self.story.append(Spacer(1, 0.3*inch))
+        self.story.append(rl.Spacer(1, 0.3*rl.inch))
     
     def add_section(self, title: str):
         """Add section header."""
-        header = Paragraph(title, self.styles['SectionHeader'])
+        rl = self._rl
+        header = rl.Paragraph(title, self.styles['SectionHeader'])
         self.story.append(header)
     
     def add_kpi_table(self, call_metrics: pd.Series):
         """Add KPI summary table."""
+        rl = self._rl
+        
+        # Read all values once instead of per-label Series lookups
+        m = call_metrics.to_dict()
         
         kpis = [
             ['Metric', 'Value'],
-            ['Total Duration', f"{call_metrics['total_duration']:.1f} s"],
-            ['Speech Time', f"{call_metrics['speech_time']:.1f} s ({call_metrics['speech_ratio']:.1%})"],
-            ['Silence Time', f"{call_metrics['silence_time']:.1f} s ({call_metrics['silence_ratio']:.1%})"],
-            ['Overlap Time', f"{call_metrics['overlap_time']:.1f} s ({call_metrics['overlap_ratio']:.1%})"],
-            ['Total Utterances', str(int(call_metrics['total_utterances']))],
-            ['Speaker Switches', str(int(call_metrics['speaker_switches']))],
-            ['Interruptions', str(int(call_metrics['interruptions_total']))],
+            ['Total Duration', f"{m['total_duration']:.1f} s"],
+            ['Speech Time', f"{m['speech_time']:.1f} s ({m['speech_ratio']:.1%})"],
+            ['Silence Time', f"{m['silence_time']:.1f} s ({m['silence_ratio']:.1%})"],
+            ['Overlap Time', f"{m['overlap_time']:.1f} s ({m['overlap_ratio']:.1%})"],
+            ['Total Utterances', str(int(m['total_utterances']))],
+            ['Speaker Switches', str(int(m['speaker_switches']))],
+            ['Interruptions', str(int(m['interruptions_total']))],
         ]
         
-        table = Table(kpis, colWidths=[3*inch, 3*inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2E86AB')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        table = rl.Table(kpis, colWidths=[3*rl.inch, 3*rl.inch])
+        table.setStyle(rl.TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), rl.colors.HexColor('#2E86AB')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), rl.colors.whitesmoke),
             ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
             ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
             ('FONTSIZE', (0, 0), (-1, 0), 12),
             ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ('BACKGROUND', (0, 1), (-1, -1), rl.colors.beige),
+            ('GRID', (0, 0), (-1, -1), 1, rl.colors.black),
         ]))
         
         self.story.append(table)
-        self.story.append(Spacer(1, 0.2*inch))
+        self.story.append(rl.Spacer(1, 0.2*rl.inch))
     
     def add_speaker_table(self, speaker_metrics: pd.DataFrame):
         """Add speaker metrics table."""
+        rl = self._rl
+        
+        header = ['Speaker', 'Speaking Time', 'Turns', 'WPM', 'Words']
         
-        data = [['Speaker', 'Speaking Time', 'Turns', 'WPM', 'Words']]
+        # Format whole columns, then zip into rows
+        speakers = speaker_metrics['speaker'].to_numpy()
+        times = speaker_metrics['apportioned_speaking_time'].map("{:.1f} s".format).to_numpy()
+        turns = speaker_metrics['turn_count'].astype(int).astype(str).to_numpy()
+        wpm = speaker_metrics['words_per_minute'].map("{:.1f}".format).to_numpy()
+        words = speaker_metrics['total_words'].astype(int).astype(str).to_numpy()
         
-        for _, row in speaker_metrics.iterrows():
-            data.append([
-                row['speaker'],
-                f"{row['apportioned_speaking_time']:.1f} s",
-                str(int(row['turn_count'])),
-                f"{row['words_per_minute']:.1f}",
-                str(int(row['total_words']))
-            ])
+        data = [header] + [list(row) for row in zip(speakers, times, turns, wpm, words)]
         
-        table = Table(data, colWidths=[1.5*inch, 1.5*inch, 1*inch, 1*inch, 1*inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#A23B72')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        table = rl.Table(data, colWidths=[1.5*rl.inch, 1.5*rl.inch, 1*rl.inch, 1*rl.inch, 1*rl.inch])
+        table.setStyle(rl.TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), rl.colors.HexColor('#A23B72')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), rl.colors.whitesmoke),
             ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
             ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
             ('FONTSIZE', (0, 0), (-1, 0), 11),
             ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.lightgrey),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ('BACKGROUND', (0, 1), (-1, -1), rl.colors.lightgrey),
+            ('GRID', (0, 0), (-1, -1), 1, rl.colors.black),
         ]))
         
         self.story.append(table)
-        self.story.append(Spacer(1, 0.2*inch))
+        self.story.append(rl.Spacer(1, 0.2*rl.inch))
     
     def add_quality_table(self, quality_metrics: pd.Series):
         """Add quality metrics table."""
+        rl = self._rl
+        
+        m = quality_metrics.to_dict()
         
         data = [
             ['Quality Metric', 'Value'],
-            ['Quality Score', f"{quality_metrics['quality_score']:.1%}"],
-            ['Invalid Timestamps', f"{quality_metrics['invalid_time_ratio']:.1%}"],
-            ['Unknown Speakers', f"{quality_metrics['unknown_speaker_ratio']:.1%}"],
-            ['Empty Text', f"{quality_metrics['empty_text_ratio']:.1%}"],
+            ['Quality Score', f"{m['quality_score']:.1%}"],
+            ['Invalid Timestamps', f"{m['invalid_time_ratio']:.1%}"],
+            ['Unknown Speakers', f"{m['unknown_speaker_ratio']:.1%}"],
+            ['Empty Text', f"{m['empty_text_ratio']:.1%}"],
         ]
         
-        table = Table(data, colWidths=[3*inch, 2*inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#F18F01')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        table = rl.Table(data, colWidths=[3*rl.inch, 2*rl.inch])
+        table.setStyle(rl.TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), rl.colors.HexColor('#F18F01')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), rl.colors.whitesmoke),
             ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
             ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
             ('FONTSIZE', (0, 0), (-1, 0), 12),
             ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.lightgoldenrodyellow),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ('BACKGROUND', (0, 1), (-1, -1), rl.colors.lightgoldenrodyellow),
+            ('GRID', (0, 0), (-1, -1), 1, rl.colors.black),
         ]))
         
         self.story.append(table)
-        self.story.append(Spacer(1, 0.2*inch))
+        self.story.append(rl.Spacer(1, 0.2*rl.inch))
     
     def add_narrative(self, text: str):
         """Add narrative text."""
+        rl = self._rl
+        
         # Split by paragraphs
         paragraphs = text.strip().split('\n\n')
         
         for para in paragraphs:
             if para.strip():
-                p = Paragraph(para.replace('\n', '<br/>'), self.styles['Normal'])
+                p = rl.Paragraph(para.replace('\n', '<br/>'), self.styles['Normal'])
                 self.story.append(p)
-                self.story.append(Spacer(1, 0.1*inch))
+                self.story.append(rl.Spacer(1, 0.1*rl.inch))
     
-    def add_chart_image(self, image_path: Path, width: float = 6*inch):
+    def add_chart_image(self, image_path: Path, width: Optional[float] = None):
         """
         Add chart image to report.
         
         Args:
             image_path: Path to PNG image
-            width: Image width in inches
+            width: Image width in points (default: 6 inches)
         """
+        rl = self._rl
         if not image_path.exists():
             return
         
-        img = Image(str(image_path), width=width)
+        if width is None:
+            width = 6*rl.inch
+        
+        img = rl.Image(str(image_path), width=width)
         self.story.append(img)
-        self.story.append(Spacer(1, 0.2*inch))
+        self.story.append(rl.Spacer(1, 0.2*rl.inch))
     
     def add_page_break(self):
         """Add page break."""
-        self.story.append(PageBreak())
+        self.story.append(self._rl.PageBreak())
     
     def build(self):
-        """Build and save PDF."""
+        """
+        Build and save PDF.
+        
+        The document is rendered in memory and then moved into place, so a
+        failed build never leaves a truncated file at output_path.
+        """
+        buf = io.BytesIO()
+        self.doc.filename = buf
         self.doc.build(self.story)
+        
+        tmp_path = self.output_path.with_name(self.output_path.name + '.tmp')
+        tmp_path.write_bytes(buf.getvalue())
+        os.replace(tmp_path, self.output_path)
 
 
-def export_plotly_to_png(fig: go.Figure, output_path: Path, width: int = 1200, height: int = 600):
+def export_plotly_to_png(fig: "go.Figure", output_path: Path, width: int = 1200, height: int = 600):
     """
     Export Plotly figure to PNG using kaleido.
     
@@ -234,12 +306,30 @@ def export_plotly_to_png(fig: go.Figure, output_path: Path, width: int = 1200, h
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    fig.write_image(
-        str(output_path),
-        width=width,
-        height=height,
-        scale=2  # For higher resolution
-    )
+    _configure_kaleido()
+    
+    # Same figure JSON and size -> same PNG
+    fig_json = fig.to_json(validate=False)
+    key = hashlib.blake2b(
+        f"{width}x{height}:{fig_json}".encode(),
+        digest_size=16
+    ).hexdigest()
+    
+    png = _png_cache.get(key)
+    if png is None:
+        png = fig.to_image(
+            format='png',
+            width=width,
+            height=height,
+            scale=2  # For higher resolution
+        )
+        _png_cache[key] = png
+        if len(_png_cache) > PNG_CACHE_SIZE:
+            _png_cache.popitem(last=False)
+    else:
+        _png_cache.move_to_end(key)
+    
+    output_path.write_bytes(png)
 
 
 def generate_call_report(
@@ -302,3 +392,16 @@ def generate_call_report(
     
     # Build PDF
     generator.build()
+
+
+@cache
+def _configure_kaleido():
+    """Configure the shared kaleido scope once per process."""
+    import plotly.io as pio
+    
+    # One kaleido scope serves all charts; MathJax is not needed for these
+    # charts and slows down browser startup
+    scope = getattr(pio.kaleido, 'scope', None)
+    if scope is not None:
+        scope.mathjax = None
+        scope.default_format = 'png'
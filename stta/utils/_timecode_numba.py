@@ -0,0 +1,153 @@
+"""
+Numba kernel for bulk timecode parsing.
+
+The kernel walks the UTF-8 bytes of a whole column (Arrow layout: one
+data buffer plus offsets) and parses SS[.mmm] and [HH:]MM:SS[.mmm]
+without creating Python strings. Values it cannot parse exactly with
+the same result as parse_timecode (invalid input, non-ASCII, very long
+numbers) are flagged for the scalar fallback.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Optional, Tuple
+
+from .jit import njit
+
+
+# Longest digit run the kernel accepts (keeps integers below 2**53)
+_MAX_DIGITS = 15
+
+# Longest seconds-only value whose total milliseconds stay below 2**53
+_MAX_SECONDS_DIGITS = 12
+
+# Hours above this would put total milliseconds past 2**53
+_MAX_HOURS = 2 ** 53 // 3_600_000
+
+
+def parse_timecode_array(values: pd.Series) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Parse a Series of timecode strings with the Numba kernel.
+
+    Args:
+        values: Series of timecode strings
+
+    Returns:
+        (seconds, fallback) arrays, where fallback marks values that must go
+        through parse_timecode; None if the column is not all strings
+    """
+    import pyarrow as pa
+
+    try:
+        arr = pa.array(values, type=pa.large_string(), from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return None
+
+    # Arrow-backed Series (e.g. after pd.concat) come back chunked
+    if isinstance(arr, pa.ChunkedArray):
+        arr = arr.combine_chunks()
+    if not isinstance(arr, pa.LargeStringArray):
+        return None
+
+    _, offsets_buf, data_buf = arr.buffers()
+    offsets = np.frombuffer(offsets_buf, dtype=np.int64)[arr.offset:arr.offset + len(arr) + 1]
+    data = np.frombuffer(data_buf, dtype=np.uint8) if data_buf is not None else np.zeros(0, dtype=np.uint8)
+    valid = arr.is_valid().to_numpy(zero_copy_only=False)
+
+    seconds = np.empty(len(arr), dtype=np.float64)
+    fallback = np.empty(len(arr), dtype=np.bool_)
+    _parse_timecode_bytes(data, offsets, valid, seconds, fallback)
+
+    return seconds, fallback
+
+
+@njit(cache=True, nogil=True)
+def _is_space(c):
+    """ASCII whitespace (as stripped by str.strip)."""
+    return c == 32 or (9 <= c <= 13) or (28 <= c <= 31)
+
+
+@njit(cache=True, nogil=True)
+def _parse_timecode_bytes(data, offsets, valid, out, fallback):
+    """Parse each byte range data[offsets[i]:offsets[i+1]] into out[i]."""
+    for i in range(offsets.shape[0] - 1):
+        out[i] = np.nan
+        fallback[i] = True
+        if not valid[i]:
+            continue
+
+        lo = offsets[i]
+        hi = offsets[i + 1]
+        while lo < hi and _is_space(data[lo]):
+            lo += 1
+        while hi > lo and _is_space(data[hi - 1]):
+            hi -= 1
+        if lo == hi:
+            continue
+
+        # Fields separated by ':'; the last may have a ',' / '.' fraction
+        f0 = 0
+        f1 = 0
+        field = 0
+        n_colons = 0
+        digits = 0
+        in_frac = False
+        frac_digits = 0
+        ms = 0
+        ok = True
+
+        for j in range(lo, hi):
+            c = data[j]
+            if 48 <= c <= 57:
+                d = c - 48
+                if in_frac:
+                    if frac_digits < 3:
+                        ms = ms * 10 + d
+                    frac_digits += 1
+                else:
+                    field = field * 10 + d
+                    digits += 1
+                    if digits > _MAX_DIGITS:
+                        ok = False
+                        break
+            elif c == 58 and not in_frac:  # ':'
+                if digits == 0 or n_colons == 2:
+                    ok = False
+                    break
+                f0 = f1
+                f1 = field
+                field = 0
+                digits = 0
+                n_colons += 1
+            elif (c == 46 or c == 44) and not in_frac:  # '.' or ','
+                if digits == 0:
+                    ok = False
+                    break
+                in_frac = True
+            else:
+                ok = False
+                break
+
+        if not ok or digits == 0 or (in_frac and frac_digits == 0):
+            continue
+
+        if frac_digits < 3:
+            for _ in range(3 - frac_digits):
+                ms *= 10
+
+        # Colon forms: range errors are left to the scalar parser
+        if n_colons == 0:
+            if digits > _MAX_SECONDS_DIGITS:
+                continue
+            hours, minutes = 0, 0
+        elif n_colons == 2:
+            hours, minutes = f0, f1
+        else:
+            hours, minutes = 0, f1
+        if n_colons and (minutes >= 60 or field >= 60 or hours >= _MAX_HOURS):
+            continue
+
+        # Same integer milliseconds and single division as parse_timecode
+        total_ms = ((hours * 60 + minutes) * 60 + field) * 1000 + ms
+        out[i] = total_ms / 1000.0
+        fallback[i] = False
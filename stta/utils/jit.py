@@ -0,0 +1,62 @@
+"""
+Optional Numba JIT support.
+
+Numba is an optional dependency (install with `pip install stta[perf]`).
+When it is missing, `njit` leaves the decorated function as plain Python
+so kernels stay importable; callers check `NUMBA_AVAILABLE` to choose a
+NumPy path instead of running the kernel loop in the interpreter.
+
+Importing numba takes ~0.2 s, so it is only imported (and the kernel
+compiled) on the first call of a decorated function; commands that never
+run a kernel do not pay for it.
+"""
+
+import functools
+from importlib.util import find_spec
+from typing import Callable
+
+NUMBA_AVAILABLE = find_spec('numba') is not None
+
+
+class _LazyKernel:
+    """Compiles the wrapped function with numba.njit on first call."""
+
+    def __init__(self, func: Callable, options: dict):
+        functools.update_wrapper(self, func)
+        self._func = func
+        self._options = options
+        self._dispatcher = None
+
+    def compile(self):
+        """Return the Numba dispatcher, compiling on first use."""
+        if self._dispatcher is None:
+            from numba import njit as numba_njit
+
+            # Kernels called from this one must be real dispatchers when
+            # Numba resolves the globals
+            module_globals = self._func.__globals__
+            for name in self._func.__code__.co_names:
+                callee = module_globals.get(name)
+                if isinstance(callee, _LazyKernel):
+                    module_globals[name] = callee.compile()
+
+            self._dispatcher = numba_njit(**self._options)(self._func)
+        return self._dispatcher
+
+    def __call__(self, *args, **kwargs):
+        return self.compile()(*args, **kwargs)
+
+
+def njit(*args, **kwargs) -> Callable:
+    """
+    Compile function with numba.njit if available, otherwise no-op.
+
+    Supports both `@njit` and `@njit(cache=True, ...)` forms.
+    """
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return _LazyKernel(args[0], {}) if NUMBA_AVAILABLE else args[0]
+
+    if NUMBA_AVAILABLE:
+        return lambda func: _LazyKernel(func, kwargs)
+
+    return lambda func: func
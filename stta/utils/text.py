@@ -1,10 +1,25 @@
 """Text processing utilities."""
 
 import re
+import pandas as pd
+from functools import lru_cache
 from typing import Optional
 
 
-def count_words(text: Optional[str], pattern: str = r"\w+") -> int:
+# Default word pattern (\w is Unicode-aware for str patterns)
+WORD_PATTERN = r"\w+"
+
+_WORD_RE = re.compile(WORD_PATTERN)
+_WS_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=32)
+def _compile(pattern: str) -> re.Pattern:
+    """Compile a custom word pattern once."""
+    return re.compile(pattern, re.UNICODE)
+
+
+def count_words(text: Optional[str], pattern: str = WORD_PATTERN) -> int:
     """
     Count words in text using Unicode-aware regex.
     
@@ -26,8 +41,8 @@ def count_words(text: Optional[str], pattern: str = r"\w+") -> int:
     if not text:
         return 0
     
-    matches = re.findall(pattern, text, re.UNICODE)
-    return len(matches)
+    word_re = _WORD_RE if pattern == WORD_PATTERN else _compile(pattern)
+    return len(word_re.findall(text))
 
 
 def count_chars(text: Optional[str], exclude_whitespace: bool = False) -> int:
@@ -45,11 +60,48 @@ def count_chars(text: Optional[str], exclude_whitespace: bool = False) -> int:
         return 0
     
     if exclude_whitespace:
-        return len(re.sub(r'\s+', '', text))
+        return len(_WS_RE.sub('', text))
     
     return len(text)
 
 
+def count_words_series(texts: pd.Series) -> pd.Series:
+    """
+    Count words for a whole column (same counts as count_words per value).
+    
+    Prefer this over applying count_words row by row when building
+    utterance frames: the regex runs in one pass over the column.
+    
+    Args:
+        texts: Series of text (missing values count as 0 words)
+        
+    Returns:
+        Integer Series of word counts
+    """
+    # flags force Python's re (Unicode \w); Arrow-backed strings would
+    # otherwise use RE2, where \w is ASCII-only
+    return texts.fillna('').astype(str).str.count(WORD_PATTERN, flags=re.UNICODE)
+
+
+def char_count_series(texts: pd.Series, exclude_whitespace: bool = False) -> pd.Series:
+    """
+    Count characters for a whole column (same counts as count_chars per value).
+    
+    Args:
+        texts: Series of text (missing values count as 0)
+        exclude_whitespace: If True, exclude whitespace characters
+        
+    Returns:
+        Integer Series of character counts
+    """
+    texts = texts.fillna('').astype(str)
+    
+    if exclude_whitespace:
+        texts = texts.str.replace(r"\s+", '', regex=True, flags=re.UNICODE)
+    
+    return texts.str.len()
+
+
 def normalize_text(text: Optional[str]) -> str:
     """
     Normalize text for consistent processing.
@@ -68,7 +120,7 @@ def normalize_text(text: Optional[str]) -> str:
         return ""
     
     # Strip and collapse whitespace
-    normalized = re.sub(r'\s+', ' ', text.strip())
+    normalized = _WS_RE.sub(' ', text.strip())
     return normalized
 
 
@@ -1,5 +1,6 @@
 """Validation utilities."""
 
+import stat
 from typing import Any, Optional
 from pathlib import Path
 
@@ -15,10 +16,13 @@ def validate_file_exists(path: Path, description: str = "File") -> None:
     Raises:
         FileNotFoundError: If file doesn't exist
     """
-    if not path.exists():
-        raise FileNotFoundError(f"{description} not found: {path}")
+    # One stat() call instead of exists() + is_file()
+    try:
+        mode = path.stat().st_mode
+    except (FileNotFoundError, NotADirectoryError):
+        raise FileNotFoundError(f"{description} not found: {path}") from None
     
-    if not path.is_file():
+    if not stat.S_ISREG(mode):
         raise ValueError(f"{description} is not a file: {path}")
 
 
@@ -33,10 +37,13 @@ def validate_dir_exists(path: Path, description: str = "Directory") -> None:
     Raises:
         FileNotFoundError: If directory doesn't exist
     """
-    if not path.exists():
-        raise FileNotFoundError(f"{description} not found: {path}")
+    # One stat() call instead of exists() + is_dir()
+    try:
+        mode = path.stat().st_mode
+    except (FileNotFoundError, NotADirectoryError):
+        raise FileNotFoundError(f"{description} not found: {path}") from None
     
-    if not path.is_dir():
+    if not stat.S_ISDIR(mode):
         raise ValueError(f"{description} is not a directory: {path}")
 
 
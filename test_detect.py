@@ -11,7 +11,8 @@ df = pd.read_csv(
     sep=';',
     dtype=str,
     keep_default_na=False,
-    encoding='utf-8-sig',
+    encoding='utf-8',
+    memory_map=True,
     nrows=50
 )
 
@@ -13,6 +13,7 @@ df = pd.read_csv(
     dtype=str,
     keep_default_na=False,
     encoding='utf-8',
+    memory_map=True,
     nrows=5
 )
 
@@ -0,0 +1,47 @@
+"""Shared pytest fixtures."""
+
+import pytest
+import pandas as pd
+import yaml
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+RAW_CSV = ROOT / 'data' / 'raw' / 'DATA.csv'
+
+
+@pytest.fixture(scope='session')
+def config():
+    """Default configuration."""
+    with open(ROOT / 'config' / 'default.yml', 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f)
+
+
+@pytest.fixture(scope='session')
+def raw_csv_df(request):
+    """
+    Raw export (data/raw/DATA.csv) as strings, read once per session.
+
+    The parsed frame is cached as Parquet in the pytest cache directory
+    and reused while it is newer than the CSV.
+    """
+    if not RAW_CSV.exists():
+        pytest.skip(f"{RAW_CSV.relative_to(ROOT)} not available")
+
+    cache = request.config.cache.mkdir('raw_csv') / 'DATA.parquet'
+    if cache.exists() and cache.stat().st_mtime >= RAW_CSV.stat().st_mtime:
+        return pd.read_parquet(cache)
+
+    # pyarrow engine skips a UTF-8 BOM on its own
+    df = pd.read_csv(
+        RAW_CSV,
+        sep=';',
+        dtype=str,
+        keep_default_na=False,
+        encoding='utf-8',
+        engine='pyarrow',
+        dtype_backend='pyarrow'
+    )
+    df.to_parquet(cache)
+
+    return df
@@ -0,0 +1,32 @@
+"""Tests for optional Numba support."""
+
+import subprocess
+import sys
+
+import numpy as np
+from stta.utils.jit import njit
+
+
+@njit(cache=False)
+def _double(x):
+    return 2 * x
+
+
+@njit
+def _double_sum(values):
+    total = 0.0
+    for v in values:
+        total += _double(v)
+    return total
+
+
+def test_cli_import_does_not_load_numba():
+    """Test numba is imported on first kernel call, not at CLI startup."""
+    code = "import sys, stta.cli; print('numba' in sys.modules)"
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == 'False'
+
+
+def test_kernel_calling_kernel():
+    """Test a kernel can call another (lazily compiled) kernel."""
+    assert _double_sum(np.array([1.0, 2.0, 3.0])) == 12.0
@@ -0,0 +1,20 @@
+"""Checks on the raw CSV export (skipped when data/raw/DATA.csv is absent)."""
+
+import pytest
+
+
+class TestRawExport:
+    """Test the raw export against the configured column mapping."""
+
+    def test_mapped_columns_present(self, raw_csv_df, config):
+        """Mapped column names include the configured fields."""
+        parsing = config['parsing']
+        renamed = raw_csv_df.rename(columns=parsing['column_mapping'])
+
+        for key in ('call_id_field', 'speaker_field', 'text_field',
+                    'start_time_field', 'end_time_field'):
+            assert parsing[key] in renamed.columns
+
+    def test_first_column_not_bom_prefixed(self, raw_csv_df):
+        """BOM is stripped from the first header."""
+        assert not raw_csv_df.columns[0].startswith('\ufeff')
@@ -0,0 +1,110 @@
+"""Tests for CSV reader."""
+
+import pandas as pd
+import pytest
+from stta.io import reader as reader_module
+from stta.io.reader import CSVReader, ENCODING_SAMPLE_BYTES
+
+
+HEADER = 'Datum;agent_name;customer_id;direction;call_duration;speaker;start_time;end_time;text'
+CZECH_TEXT = 'Dobrý den, přeji hezký den'
+
+
+def write_calls(path, utterance_counts):
+    """Write a multi-call CSV, one call per entry of utterance_counts."""
+    rows = [HEADER]
+    for c, n_utterances in enumerate(utterance_counts):
+        rows.append(f'2024-01-01 10:{c:02d};Agent{c % 3};C{c};IN;60;;;;')
+        for u in range(n_utterances):
+            speaker = 'agent' if u % 2 else 'customer'
+            rows.append(f';;;;;{speaker};{2 * u},5;{2 * u + 1};{CZECH_TEXT} {u}')
+    path.write_text('\n'.join(rows) + '\n', encoding='utf-8')
+    return path
+
+
+@pytest.fixture
+def reader():
+    """Create reader with the default encodings."""
+    return CSVReader(speaker_mapping={'agent': 'AGENT', 'customer': 'CUSTOMER'})
+
+
+class TestEncoding:
+    """Test encoding detection and fallback."""
+
+    def test_non_ascii_after_sample(self, reader, tmp_path):
+        """Test cp1250 text past the sniffed sample is decoded, not replaced."""
+        rows = [HEADER, '2024-01-01 10:00;Agent1;C1;IN;60;;;;']
+        while sum(len(r) + 1 for r in rows) <= ENCODING_SAMPLE_BYTES:
+            rows.append(';;;;;agent;1.0;2.0;ascii only filler text')
+        rows.append(f';;;;;customer;3.0;4.0;{CZECH_TEXT}')
+
+        path = tmp_path / 'calls.csv'
+        path.write_bytes(('\n'.join(rows) + '\n').encode('cp1250'))
+
+        _, utterances_df = reader.read_csv_file(path, {})
+
+        assert CZECH_TEXT in utterances_df['text'].tolist()
+        assert not utterances_df['text'].str.contains('\ufffd').any()
+
+
+class TestReadCsvFiles:
+    """Test batch reading with prefetch."""
+
+    def test_large_files_not_prefetched(self, reader, tmp_path, monkeypatch):
+        """Test files above STREAM_MIN_BYTES stream from disk with the same result."""
+        small = write_calls(tmp_path / 'small.csv', [3, 3])
+        large = write_calls(tmp_path / 'large.csv', [10] * 5)
+        _, expected = reader.read_csv_file(large, {})
+        monkeypatch.setattr(reader_module, 'STREAM_MIN_BYTES', small.stat().st_size)
+
+        assert reader_module._prefetch_bytes(small) is not None
+        assert reader_module._prefetch_bytes(large) is None
+
+        results = list(reader.read_csv_files([small, large], {}))
+
+        assert [(path, error) for path, _, error in results] == [(small, None), (large, None)]
+        _, utterances_df = results[1][1]
+        assert utterances_df.equals(expected)
+
+
+class TestStreaming:
+    """Test chunked reading against whole-file reading."""
+
+    def read_both(self, reader, path, chunk_rows, monkeypatch):
+        """Read path whole, then in chunks of chunk_rows rows."""
+        whole = reader.read_csv_file(path, {})
+
+        monkeypatch.setattr(reader_module, 'STREAM_MIN_BYTES', 0)
+        monkeypatch.setattr(reader_module, 'STREAM_CHUNK_ROWS', chunk_rows)
+        chunked = reader.read_csv_file(path, {})
+
+        return whole, chunked
+
+    def assert_same(self, whole, chunked):
+        """Calls (except ingestion time) and utterances are identical."""
+        pd.testing.assert_frame_equal(
+            whole[0].drop(columns='ingested_at'), chunked[0].drop(columns='ingested_at')
+        )
+        pd.testing.assert_frame_equal(whole[1], chunked[1])
+
+    @pytest.mark.parametrize("chunk_rows", [1, 3, 4, 7, 100])
+    def test_calls_across_chunks(self, reader, tmp_path, monkeypatch, chunk_rows):
+        """Test calls split over chunks, ending with a carry-over-only chunk."""
+        # 49 rows; the last call starts at row 30, so the final chunks hold
+        # only its utterance rows. Calls of 16+ rows hit the timecode kernel
+        path = write_calls(tmp_path / 'calls.csv', [1, 2, 20, 3, 18])
+
+        whole, chunked = self.read_both(reader, path, chunk_rows, monkeypatch)
+
+        assert len(chunked[0]) == 5
+        self.assert_same(whole, chunked)
+
+    def test_whole_file_fallback(self, reader, tmp_path, monkeypatch):
+        """Test a first chunk without the multi-call layout falls back to the whole file."""
+        # First chunk holds a single call boundary row
+        path = write_calls(tmp_path / 'calls.csv', [20, 2, 3])
+
+        whole, chunked = self.read_both(reader, path, 4, monkeypatch)
+
+        assert len(chunked[0]) == 3
+        self.assert_same(whole, chunked)
@@ -1,64 +1,91 @@
 """Tests for timecode parsing utilities."""
 
+import math
+import pandas as pd
 import pytest
-from stta.utils.timecode import parse_timecode, format_timecode, validate_time_range
+from stta.utils.timecode import (
+    parse_timecode, parse_timecode_series, format_timecode,
+    validate_time_range, validate_time_range_legacy, TimeRangeStatus
+)
 
 
 class TestParseTimecode:
     """Test timecode parsing."""
     
-    def test_seconds_only(self):
-        """Test parsing seconds."""
-        assert parse_timecode("45") == 45.0
-        assert parse_timecode("45.5") == 45.5
-        assert parse_timecode("45,5") == 45.5  # Decimal comma
+    @pytest.mark.parametrize("value,expected", [
+        ("45", 45.0),
+        ("45.5", 45.5),
+        ("45,5", 45.5),  # Decimal comma
+        ("125.5", 125.5),  # Seconds-only may exceed 60
+        ("12.3456", 12.345),  # Truncated to milliseconds
+        ("0:12.3456", 12.345),
+        ("1:30", 90.0),  # MM:SS
+        ("2:05", 125.0),
+        ("0:45", 45.0),
+        ("1:30.500", 90.5),  # MM:SS.mmm
+        ("2:05.250", 125.25),
+        ("1:02:30", 3750.0),  # HH:MM:SS
+        ("0:01:30", 90.0),
+        ("1:02:30.500", 3750.5),  # HH:MM:SS.mmm
+        (45, 45.0),  # Numeric input
+        (45.5, 45.5),
+    ])
+    def test_valid(self, value, expected):
+        """Test supported formats."""
+        assert parse_timecode(value) == expected
     
-    def test_mm_ss(self):
-        """Test MM:SS format."""
-        assert parse_timecode("1:30") == 90.0
-        assert parse_timecode("2:05") == 125.0
-        assert parse_timecode("0:45") == 45.0
-    
-    def test_mm_ss_mmm(self):
-        """Test MM:SS.mmm format."""
-        assert parse_timecode("1:30.500") == 90.5
-        assert parse_timecode("2:05.250") == 125.25
+    @pytest.mark.parametrize("value", [
+        "-10",  # Negative
+        "abc",  # Non-numeric
+        "",  # Empty
+        None,
+        "5:70",  # Seconds >= 60 (MM:SS)
+        "1:05:70",  # Seconds >= 60
+        "1:70:05",  # Minutes >= 60
+        "-0",
+        "-0.0",
+        "1e3",  # float() syntax is not a timecode
+        "1_000",
+        "+5",
+        "45.",
+        " .5",
+        "inf",
+        "nan",
+    ])
+    def test_invalid(self, value):
+        """Test invalid formats and ranges."""
+        with pytest.raises(ValueError):
+            parse_timecode(value)
+
+
+class TestParseTimecodeSeries:
+    """Test vectorized timecode parsing."""
     
-    def test_hh_mm_ss(self):
-        """Test HH:MM:SS format."""
-        assert parse_timecode("1:02:30") == 3750.0
-        assert parse_timecode("0:01:30") == 90.0
+    def test_matches_scalar(self):
+        """Test Series parsing matches parse_timecode."""
+        # Long enough for the bulk (kernel) path
+        values = ["45", "45,5", "1:30", "2:05.250", "1:02:30.500", "75.125", "0:01:30", " 7 "] * 4
+        result = parse_timecode_series(pd.Series(values))
+        assert result.tolist() == [parse_timecode(v) for v in values]
     
-    def test_hh_mm_ss_mmm(self):
-        """Test HH:MM:SS.mmm format."""
-        assert parse_timecode("1:02:30.500") == 3750.5
+    def test_chunked_arrow_series(self):
+        """Test concatenated pyarrow-backed Series (chunked storage)."""
+        part = pd.Series(["45,5", "1:30", "2:05.250", "abc"] * 5, dtype="string[pyarrow]")
+        values = pd.concat([part, part], ignore_index=True)
+        result = parse_timecode_series(values, errors="coerce")
+        assert result[:3].tolist() == [45.5, 90.0, 125.25]
+        assert result.isna().sum() == 10
     
-    def test_numeric_input(self):
-        """Test numeric input."""
-        assert parse_timecode(45) == 45.0
-        assert parse_timecode(45.5) == 45.5
+    def test_coerce_invalid(self):
+        """Test invalid values become NaN with errors='coerce'."""
+        result = parse_timecode_series(pd.Series(["abc", "", "-10", "5:70", "1:30"]), errors="coerce")
+        assert all(math.isnan(x) for x in result[:4])
+        assert result[4] == 90.0
     
-    def test_invalid_formats(self):
-        """Test invalid formats."""
-        with pytest.raises(ValueError):
-            parse_timecode("-10")  # Negative
-        
-        with pytest.raises(ValueError):
-            parse_timecode("abc")  # Non-numeric
-        
+    def test_raise_invalid(self):
+        """Test invalid values raise by default."""
         with pytest.raises(ValueError):
-            parse_timecode("")  # Empty
-        
-        with pytest.raises(ValueError):
-            parse_timecode(None)  # None
-    
-    def test_invalid_ranges(self):
-        """Test invalid time ranges."""
-        with pytest.raises(ValueError):
-            parse_timecode("5:70")  # Minutes >= 60
-        
-        with pytest.raises(ValueError):
-            parse_timecode("1:05:70")  # Seconds >= 60
+            parse_timecode_series(pd.Series(["1:30", "abc"]))
 
 
 class TestFormatTimecode:
@@ -84,26 +111,20 @@ class TestValidateTimeRange:
     
     def test_valid_range(self):
         """Test valid time range."""
-        valid, reason = validate_time_range(10.0, 15.0)
-        assert valid is True
-        assert reason == ""
+        assert validate_time_range(10.0, 15.0) == TimeRangeStatus.OK
     
     def test_nonpositive_duration(self):
         """Test nonpositive duration."""
-        valid, reason = validate_time_range(15.0, 10.0)
-        assert valid is False
-        assert reason == "nonpositive_duration"
-        
-        valid, reason = validate_time_range(10.0, 10.0)
-        assert valid is False
-        assert reason == "nonpositive_duration"
+        assert validate_time_range(15.0, 10.0) == TimeRangeStatus.NONPOSITIVE
+        assert validate_time_range(10.0, 10.0) == TimeRangeStatus.NONPOSITIVE
     
     def test_negative_time(self):
         """Test negative time."""
-        valid, reason = validate_time_range(-5.0, 10.0)
-        assert valid is False
-        assert reason == "negative_time"
-        
-        valid, reason = validate_time_range(5.0, -10.0)
-        assert valid is False
-        assert reason == "negative_time"
+        assert validate_time_range(-5.0, 10.0) == TimeRangeStatus.NEGATIVE
+        assert validate_time_range(5.0, -10.0) == TimeRangeStatus.NEGATIVE
+    
+    def test_legacy_reasons(self):
+        """Test legacy (is_valid, reason) wrapper."""
+        assert validate_time_range_legacy(10.0, 15.0) == (True, "")
+        assert validate_time_range_legacy(15.0, 10.0) == (False, "nonpositive_duration")
+        assert validate_time_range_legacy(-5.0, 10.0) == (False, "negative_time")
@@ -1,19 +1,22 @@
 """Tests for timeline calculations (sweep-line algorithm)."""
 
 import pytest
+import numpy as np
 import pandas as pd
-from stta.metrics.timeline import TimelineCalculator
+from stta.metrics.timeline import (
+    TimelineCalculator, _sweep_events, _sweep_arrays, _sweep_compiled
+)
 
 
 class TestTimelineCalculator:
     """Test timeline calculations."""
     
-    @pytest.fixture
+    @pytest.fixture(scope='module')
     def calculator(self):
         """Create calculator instance."""
         return TimelineCalculator()
     
-    @pytest.fixture
+    @pytest.fixture(scope='module')
     def simple_utterances(self):
         """Create simple test data."""
         data = {
@@ -25,7 +28,7 @@ class TestTimelineCalculator:
         }
         return pd.DataFrame(data)
     
-    @pytest.fixture
+    @pytest.fixture(scope='module')
     def overlapping_utterances(self):
         """Create overlapping test data."""
         data = {
@@ -100,12 +103,19 @@ class TestTimelineCalculator:
         assert len(gaps) == 2  # 3 utterances = 2 gaps
         assert all(g['gap_sec'] == 0.0 for g in gaps)  # No gaps
     
+    def test_gaps_unsorted_input(self, calculator, overlapping_utterances):
+        """Test gaps are computed in start order for reordered input."""
+        shuffled = overlapping_utterances.iloc[::-1]
+        
+        assert calculator.compute_gaps(shuffled) == calculator.compute_gaps(overlapping_utterances)
+    
     def test_turns_computation(self, calculator, simple_utterances):
         """Test turn computation."""
-        # Add utterance_index
-        simple_utterances['utterance_index'] = range(len(simple_utterances))
+        # Add utterance_index (on a copy: the fixture is shared)
+        df = simple_utterances.copy()
+        df['utterance_index'] = range(len(df))
         
-        turns = calculator.compute_turns(simple_utterances)
+        turns = calculator.compute_turns(df)
         
         # Should be 3 turns (AGENT, CUSTOMER, AGENT)
         assert len(turns) == 3
@@ -137,3 +147,44 @@ class TestTimelineCalculator:
         assert L >= 0
         assert O >= 0
         assert S >= 0
+    
+    def test_vectorized_sweep_matches_event_loop(self):
+        """Test NumPy and compiled sweeps against the event-loop reference."""
+        rng = np.random.default_rng(0)
+        start = np.round(rng.uniform(0, 100, 200), 1)
+        end = start + np.round(rng.uniform(0, 5, 200), 1)
+        speakers = pd.Series(rng.choice(['AGENT', 'CUSTOMER', 'OTHER'], 200))
+        
+        L_ref, O_ref, app_ref = _sweep_events(start, end, speakers.to_numpy())
+        
+        for sweep in (_sweep_arrays, _sweep_compiled):
+            L, O, app = sweep(start, end, speakers)
+            
+            assert L == pytest.approx(L_ref)
+            assert O == pytest.approx(O_ref)
+            assert app.keys() == app_ref.keys()
+            for speaker in app_ref:
+                assert app[speaker] == pytest.approx(app_ref[speaker])
+    
+    @pytest.mark.parametrize("n", [10, 40, 60, 200])
+    @pytest.mark.parametrize("seed", range(5))
+    def test_fully_covered_timeline_has_no_silence(self, calculator, n, seed):
+        """Test back-to-back utterances give S == 0 on every sweep path."""
+        rng = np.random.default_rng(seed)
+        bounds = np.round(np.cumsum(rng.uniform(0.1, 5, n + 1)), 3)
+        df = pd.DataFrame({
+            'start_sec': bounds[:-1],
+            'end_sec': bounds[1:],
+            'duration_sec': bounds[1:] - bounds[:-1],
+            'speaker': rng.choice(['AGENT', 'CUSTOMER'], n),
+            'valid_time': True
+        })
+        
+        L_ref = _sweep_events(df['start_sec'].to_numpy(), df['end_sec'].to_numpy(), df['speaker'].to_numpy())[0]
+        for sweep in (_sweep_arrays, _sweep_compiled):
+            assert sweep(df['start_sec'].to_numpy(), df['end_sec'].to_numpy(), df['speaker'])[0] == pytest.approx(L_ref)
+        
+        stats = calculator.compute_timeline_stats(df)
+        
+        assert stats['S'] == 0.0
+        assert stats['L'] == pytest.approx(stats['T'])